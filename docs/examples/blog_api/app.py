@@ -10,75 +10,86 @@ Run with: python app.py
 from __future__ import annotations
 
 import os
+import re
 import time
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Optional
 
+import orjson
 import uvicorn
 
 # Import route modules
-from routes.auth import auth_router
+from routes.auth import register_routes as register_auth_routes
 from routes.posts import posts_router
 
 # Import utilities
 from utils.database import init_database
 
-from artanis import App, Router
+from artanis import App, Request, Response, Router
 from artanis.logging import ArtanisLogger
-from artanis.middleware import ExceptionHandlerMiddleware
+from artanis.middleware import (
+    ExceptionHandlerMiddleware,
+    ProductionExceptionHandlerMiddleware,
+)
 from artanis.middleware.security import (
     CORSMiddleware,
-    RateLimitMiddleware,
     SecurityHeadersMiddleware,
+    TokenBucketRateLimitMiddleware,
 )
 
 # ================================
 # CONFIGURATION
 # ================================
 
+# Bound once so every Config default is a plain mapping lookup
+_ENV = os.environ
+
+# Parsed once at import; each Config gets its own copy via default_factory
+_CORS_ORIGINS_DEFAULT: list[str] = (
+    origins.split(",") if (origins := _ENV.get("CORS_ORIGINS")) else []
+)
+
 
 @dataclass
 class Config:
     """Application configuration."""
 
     # Server settings
-    HOST: str = os.getenv("HOST", "127.0.0.1")
-    PORT: int = int(os.getenv("PORT", "3000"))
-    DEBUG: bool = os.getenv("DEBUG", "false").lower() == "true"
-    ENVIRONMENT: str = os.getenv("ENVIRONMENT", "development")
+    HOST: str = _ENV.get("HOST", "127.0.0.1")
+    PORT: int = int(_ENV.get("PORT", "3000"))
+    DEBUG: bool = _ENV.get("DEBUG", "false").lower() == "true"
+    ENVIRONMENT: str = _ENV.get("ENVIRONMENT", "development")
 
     # Security
     DEFAULT_DEV_SECRET: str = "dev-secret-change-in-production"  # noqa: S105
-    SECRET_KEY: str = os.getenv("SECRET_KEY", DEFAULT_DEV_SECRET)
-    JWT_ALGORITHM: str = os.getenv("JWT_ALGORITHM", "HS256")
-    JWT_EXPIRES_IN: int = int(os.getenv("JWT_EXPIRES_IN", "3600"))  # 1 hour
+    SECRET_KEY: str = _ENV.get("SECRET_KEY", DEFAULT_DEV_SECRET)
+    JWT_ALGORITHM: str = _ENV.get("JWT_ALGORITHM", "HS256")
+    JWT_EXPIRES_IN: int = int(_ENV.get("JWT_EXPIRES_IN", "3600"))  # 1 hour
 
     # Database
-    DATABASE_URL: str = os.getenv("DATABASE_URL", "sqlite:///blog.db")
+    DATABASE_URL: str = _ENV.get("DATABASE_URL", "sqlite:///blog.db")
 
     # File uploads
-    UPLOAD_DIR: str = os.getenv("UPLOAD_DIR", "uploads")
-    MAX_FILE_SIZE: int = int(os.getenv("MAX_FILE_SIZE", str(5 * 1024 * 1024)))  # 5MB
+    UPLOAD_DIR: str = _ENV.get("UPLOAD_DIR", "uploads")
+    MAX_FILE_SIZE: int = int(_ENV.get("MAX_FILE_SIZE", str(5 * 1024 * 1024)))  # 5MB
     ALLOWED_EXTENSIONS: list[str] = field(default_factory=list)
 
     # CORS
-    CORS_ORIGINS: list[str] = field(
-        default_factory=lambda: os.getenv("CORS_ORIGINS", "").split(",")
-        if os.getenv("CORS_ORIGINS")
-        else []
-    )
+    CORS_ORIGINS: list[str] = field(default_factory=lambda: list(_CORS_ORIGINS_DEFAULT))
 
     # Rate limiting
-    RATE_LIMIT_REQUESTS: int = int(os.getenv("RATE_LIMIT_REQUESTS", "100"))
-    RATE_LIMIT_WINDOW: int = int(os.getenv("RATE_LIMIT_WINDOW", "3600"))
+    RATE_LIMIT_REQUESTS: int = int(_ENV.get("RATE_LIMIT_REQUESTS", "100"))
+    RATE_LIMIT_WINDOW: int = int(_ENV.get("RATE_LIMIT_WINDOW", "3600"))
 
     # Logging
-    LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO" if not DEBUG else "DEBUG")
+    LOG_LEVEL: str = _ENV.get("LOG_LEVEL", "INFO" if not DEBUG else "DEBUG")
+
+    # Derived from ENVIRONMENT once, in __post_init__
+    is_production: bool = field(init=False)
 
-    @property
-    def is_production(self) -> bool:
-        return self.ENVIRONMENT == "production"
+    def __post_init__(self) -> None:
+        self.is_production = self.ENVIRONMENT == "production"
 
     def validate(self) -> None:
         """Validate configuration."""
@@ -86,9 +97,7 @@ class Config:
             msg = "SECRET_KEY must be set in production"
             raise ValueError(msg)
 
-        upload_path = Path(self.UPLOAD_DIR)
-        if not upload_path.exists():
-            upload_path.mkdir(parents=True, exist_ok=True)
+        Path(self.UPLOAD_DIR).mkdir(parents=True, exist_ok=True)
 
 
 config = Config()
@@ -105,6 +114,199 @@ ArtanisLogger.configure(
 
 logger = ArtanisLogger.get_logger("blog_api")
 
+# Encode every JSON response and decode every JSON body with orjson
+Response.set_json_encoder(orjson.dumps)
+Request.set_json_decoder(orjson.loads)
+
+
+# ================================
+# STATIC RESPONSES
+# ================================
+
+
+def _json_response(payload: dict[str, Any]) -> Response:
+    """Serialize a constant payload once into a reusable JSON response."""
+    response = Response()
+    response.set_header("Content-Type", "application/json")
+    response.body = orjson.dumps(payload)
+    return response
+
+
+_ROOT_RESPONSE = _json_response(
+    {
+        "name": "Blog API",
+        "version": "1.0.0",
+        "environment": config.ENVIRONMENT,
+        "endpoints": {
+            "health": "/health",
+            "docs": "/docs",
+            "auth": "/api/v1/auth",
+            "users": "/api/v1/users",
+            "posts": "/api/v1/posts",
+            "comments": "/api/v1/comments",
+        },
+        "features": [
+            "User authentication with JWT",
+            "Blog post management",
+            "Comments system",
+            "File uploads",
+            "Search and filtering",
+            "Rate limiting",
+            "Comprehensive validation",
+        ],
+    }
+)
+
+_DOCS_RESPONSE = _json_response(
+    {
+        "name": "Blog API Documentation",
+        "version": "1.0.0",
+        "base_url": f"http://{config.HOST}:{config.PORT}",
+        "authentication": {
+            "type": "Bearer JWT",
+            "header": "Authorization: Bearer <token>",
+            "login_endpoint": "/api/v1/auth/login",
+        },
+        "endpoints": {
+            "authentication": {
+                "POST /api/v1/auth/register": "Register new user",
+                "POST /api/v1/auth/login": "Login user",
+                "POST /api/v1/auth/logout": "Logout user",
+                "POST /api/v1/auth/refresh": "Refresh JWT token",
+            },
+            "users": {
+                "GET /api/v1/users/{id}": "Get user profile",
+                "PUT /api/v1/users/{id}": "Update user profile",
+                "GET /api/v1/users/{id}/posts": "Get user's posts",
+            },
+            "posts": {
+                "GET /api/v1/posts": "List posts (with filtering)",
+                "POST /api/v1/posts": "Create new post (auth required)",
+                "GET /api/v1/posts/{id}": "Get specific post",
+                "PUT /api/v1/posts/{id}": "Update post (auth required)",
+                "DELETE /api/v1/posts/{id}": "Delete post (auth required)",
+            },
+            "comments": {
+                "GET /api/v1/posts/{id}/comments": "Get post comments",
+                "POST /api/v1/posts/{id}/comments": "Create comment (auth required)",
+                "PUT /api/v1/comments/{id}": "Update comment (auth required)",
+                "DELETE /api/v1/comments/{id}": "Delete comment (auth required)",
+            },
+        },
+        "examples": {
+            "register": {
+                "method": "POST",
+                "url": "/api/v1/auth/register",
+                "body": {
+                    "username": "johndoe",
+                    "email": "john@example.com",
+                    "password": "securepassword123",
+                    "full_name": "John Doe",
+                },
+            },
+            "create_post": {
+                "method": "POST",
+                "url": "/api/v1/posts",
+                "headers": {"Authorization": "Bearer <your-jwt-token>"},
+                "body": {
+                    "title": "My First Blog Post",
+                    "content": "This is the content of my blog post...",
+                    "summary": "A brief summary",
+                    "tags": ["tech", "programming"],
+                    "category": "Technology",
+                },
+            },
+        },
+    }
+)
+
+# Only the timestamp changes between health checks, so the rest of the
+# document is encoded once and the timestamp is spliced in per request.
+_HEALTH_PREFIX = (
+    orjson.dumps(
+        {
+            "status": "healthy",
+            "environment": config.ENVIRONMENT,
+            "version": "1.0.0",
+            "database": "connected",  # In real app, check DB connection
+        }
+    )[:-1]
+    + b',"timestamp":"'
+)
+_HEALTH_SUFFIX = b'"}'
+
+# (epoch second, formatted timestamp) for the last health check
+_last_ts: tuple[int, str] = (0, "")
+
+
+def _iso_now() -> str:
+    """Return the current UTC time as ISO 8601, formatting at most once a second."""
+    global _last_ts  # noqa: PLW0603
+    now = int(time.time())
+    if now != _last_ts[0]:
+        _last_ts = (now, time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now)))
+    return _last_ts[1]
+
+
+# ================================
+# AUTHENTICATION
+# ================================
+
+# Public routes that don't require authentication
+_PUBLIC_ROUTES = frozenset({"/", "/health", "/docs"})
+
+# Posts can be read anonymously
+_PUBLIC_GET_RE = re.compile(r"^/api/v1/posts(?:/|$)")
+
+# Mock user attached to every authenticated request for demo purposes
+_DEMO_USER: dict[str, Any] = {
+    "id": 1,
+    "username": "admin",
+    "email": "admin@example.com",
+    "password": "admin123",  # In real app, use hashed passwords
+    "full_name": "Administrator",
+    "is_active": True,
+    "is_admin": True,
+    "created_at": "2024-01-01T00:00:00Z",
+}
+
+
+async def auth_middleware(request: Any, _response: Any, next_middleware: Any) -> None:
+    """Simple authentication middleware for demo purposes."""
+    scope = request.scope
+    path = scope["path"]
+    method = scope["method"]
+
+    # Public routes pass straight through; everything else gets a user
+    if not (path in _PUBLIC_ROUTES or (method == "GET" and _PUBLIC_GET_RE.match(path))):
+        # For demo purposes, just set a mock user
+        # In real implementation, validate JWT token here
+        request.current_user = _DEMO_USER  # Mock authenticated user
+    await next_middleware()
+
+
+# ================================
+# ROUTES
+# ================================
+
+
+async def root() -> Response:
+    """API root endpoint."""
+    return _ROOT_RESPONSE
+
+
+async def health_check() -> Response:
+    """Health check endpoint."""
+    response = Response()
+    response.set_header("Content-Type", "application/json")
+    response.body = _HEALTH_PREFIX + _iso_now().encode() + _HEALTH_SUFFIX
+    return response
+
+
+async def api_docs() -> Response:
+    """API documentation endpoint."""
+    return _DOCS_RESPONSE
+
 
 # ================================
 # APPLICATION FACTORY
@@ -121,9 +323,14 @@ def create_app() -> App:
     # ================================
 
     # 1. Exception handling (first)
-    exception_handler = ExceptionHandlerMiddleware(
-        debug=config.DEBUG, include_traceback=config.DEBUG
-    )
+    if config.is_production:
+        exception_handler: ExceptionHandlerMiddleware = (
+            ProductionExceptionHandlerMiddleware()
+        )
+    else:
+        exception_handler = ExceptionHandlerMiddleware(
+            debug=config.DEBUG, include_traceback=config.DEBUG
+        )
     app.use(exception_handler)
 
     # 2. Security headers (production only)
@@ -137,7 +344,7 @@ def create_app() -> App:
         app.use(security_headers)
 
     # 3. Rate limiting
-    rate_limiter = RateLimitMiddleware(
+    rate_limiter = TokenBucketRateLimitMiddleware(
         requests_per_window=config.RATE_LIMIT_REQUESTS,
         window_seconds=config.RATE_LIMIT_WINDOW,
     )
@@ -163,152 +370,9 @@ def create_app() -> App:
         )
         app.use(cors)
 
-    # ================================
-    # SIMPLE AUTHENTICATION MIDDLEWARE
-    # ================================
-
-    # In-memory user storage for demo
-    users = [
-        {
-            "id": 1,
-            "username": "admin",
-            "email": "admin@example.com",
-            "password": "admin123",  # In real app, use hashed passwords
-            "full_name": "Administrator",
-            "is_active": True,
-            "is_admin": True,
-            "created_at": "2024-01-01T00:00:00Z",
-        }
-    ]
-
-    # Simple authentication middleware
-    async def auth_middleware(
-        request: Any, _response: Any, next_middleware: Any
-    ) -> None:
-        """Simple authentication middleware for demo purposes."""
-        path = request.scope.get("path", "")
-        method = request.scope.get("method", "")
-
-        # Public routes that don't require authentication
-        public_routes = ["/", "/health", "/docs"]
-
-        # Check if this is a public route
-        if path in public_routes or (
-            method == "GET" and path.startswith("/api/v1/posts")
-        ):
-            await next_middleware()
-            return
-
-        # For demo purposes, just set a mock user
-        # In real implementation, validate JWT token here
-        request.current_user = users[0]  # Mock authenticated user
-        await next_middleware()
-
     # 5. Authentication middleware
     app.use(auth_middleware)
 
-    # ================================
-    # ROUTES
-    # ================================
-
-    async def root() -> dict[str, Any]:
-        """API root endpoint."""
-        return {
-            "name": "Blog API",
-            "version": "1.0.0",
-            "environment": config.ENVIRONMENT,
-            "endpoints": {
-                "health": "/health",
-                "docs": "/docs",
-                "auth": "/api/v1/auth",
-                "users": "/api/v1/users",
-                "posts": "/api/v1/posts",
-                "comments": "/api/v1/comments",
-            },
-            "features": [
-                "User authentication with JWT",
-                "Blog post management",
-                "Comments system",
-                "File uploads",
-                "Search and filtering",
-                "Rate limiting",
-                "Comprehensive validation",
-            ],
-        }
-
-    async def health_check() -> dict[str, Any]:
-        """Health check endpoint."""
-        return {
-            "status": "healthy",
-            "environment": config.ENVIRONMENT,
-            "version": "1.0.0",
-            "database": "connected",  # In real app, check DB connection
-            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ"),
-        }
-
-    async def api_docs() -> dict[str, Any]:
-        """API documentation endpoint."""
-        return {
-            "name": "Blog API Documentation",
-            "version": "1.0.0",
-            "base_url": f"http://{config.HOST}:{config.PORT}",
-            "authentication": {
-                "type": "Bearer JWT",
-                "header": "Authorization: Bearer <token>",
-                "login_endpoint": "/api/v1/auth/login",
-            },
-            "endpoints": {
-                "authentication": {
-                    "POST /api/v1/auth/register": "Register new user",
-                    "POST /api/v1/auth/login": "Login user",
-                    "POST /api/v1/auth/logout": "Logout user",
-                    "POST /api/v1/auth/refresh": "Refresh JWT token",
-                },
-                "users": {
-                    "GET /api/v1/users/{id}": "Get user profile",
-                    "PUT /api/v1/users/{id}": "Update user profile",
-                    "GET /api/v1/users/{id}/posts": "Get user's posts",
-                },
-                "posts": {
-                    "GET /api/v1/posts": "List posts (with filtering)",
-                    "POST /api/v1/posts": "Create new post (auth required)",
-                    "GET /api/v1/posts/{id}": "Get specific post",
-                    "PUT /api/v1/posts/{id}": "Update post (auth required)",
-                    "DELETE /api/v1/posts/{id}": "Delete post (auth required)",
-                },
-                "comments": {
-                    "GET /api/v1/posts/{id}/comments": "Get post comments",
-                    "POST /api/v1/posts/{id}/comments": "Create comment (auth required)",
-                    "PUT /api/v1/comments/{id}": "Update comment (auth required)",
-                    "DELETE /api/v1/comments/{id}": "Delete comment (auth required)",
-                },
-            },
-            "examples": {
-                "register": {
-                    "method": "POST",
-                    "url": "/api/v1/auth/register",
-                    "body": {
-                        "username": "johndoe",
-                        "email": "john@example.com",
-                        "password": "securepassword123",
-                        "full_name": "John Doe",
-                    },
-                },
-                "create_post": {
-                    "method": "POST",
-                    "url": "/api/v1/posts",
-                    "headers": {"Authorization": "Bearer <your-jwt-token>"},
-                    "body": {
-                        "title": "My First Blog Post",
-                        "content": "This is the content of my blog post...",
-                        "summary": "A brief summary",
-                        "tags": ["tech", "programming"],
-                        "category": "Technology",
-                    },
-                },
-            },
-        }
-
     # Register routes
     app.get("/", root)
     app.get("/health", health_check)
@@ -322,6 +386,8 @@ def create_app() -> App:
     api_v1 = Router()
 
     # Mount auth and posts routers
+    auth_router = Router()
+    register_auth_routes(auth_router)
     api_v1.mount("/auth", auth_router)
     api_v1.mount("/posts", posts_router)
 
@@ -363,36 +429,40 @@ app = create_app()
 # but Uvicorn will directly import `app` when run via `uvicorn app:app`.
 # For example, if you want to run it directly for debugging:
 if __name__ == "__main__":
-    logger.info("🚀 Starting Blog API - Complete Example")
-    logger.info(f"📍 Environment: {config.ENVIRONMENT}")
-    logger.info("🔧 Configuration:")
-    logger.info(f"   Host: {config.HOST}")
-    logger.info(f"   Port: {config.PORT}")
-    logger.info(f"   Debug: {config.DEBUG}")
-    logger.info(f"   Database: {config.DATABASE_URL}")
-    logger.info(f"   Upload Dir: {config.UPLOAD_DIR}")
-    logger.info("📍 API Endpoints:")
-    logger.info("   GET    /                     - API root")
-    logger.info("   GET    /health               - Health check")
-    logger.info("   GET    /docs                 - API documentation")
-    logger.info("   Router /api/v1/auth          - Authentication")
-    logger.info("   Router /api/v1/users         - User management")
-    logger.info("   Router /api/v1/posts         - Blog posts")
-    logger.info("   Router /api/v1/comments      - Comments")
-    logger.info("🔐 Features enabled:")
-    logger.info("   ✅ JWT Authentication")
-    logger.info("   ✅ Rate limiting")
-    logger.info("   ✅ File uploads")
-    logger.info("   ✅ Input validation")
-    logger.info("   ✅ CORS support")
+    startup_lines = [
+        "🚀 Starting Blog API - Complete Example",
+        f"📍 Environment: {config.ENVIRONMENT}",
+        "🔧 Configuration:",
+        f"   Host: {config.HOST}",
+        f"   Port: {config.PORT}",
+        f"   Debug: {config.DEBUG}",
+        f"   Database: {config.DATABASE_URL}",
+        f"   Upload Dir: {config.UPLOAD_DIR}",
+        "📍 API Endpoints:",
+        "   GET    /                     - API root",
+        "   GET    /health               - Health check",
+        "   GET    /docs                 - API documentation",
+        "   Router /api/v1/auth          - Authentication",
+        "   Router /api/v1/users         - User management",
+        "   Router /api/v1/posts         - Blog posts",
+        "   Router /api/v1/comments      - Comments",
+        "🔐 Features enabled:",
+        "   ✅ JWT Authentication",
+        "   ✅ Rate limiting",
+        "   ✅ File uploads",
+        "   ✅ Input validation",
+        "   ✅ CORS support",
+    ]
     if config.is_production:
-        logger.info("   ✅ Security headers")
-        logger.info("   ✅ Production logging")
-    logger.info("🌐 Server starting...")
+        startup_lines += ["   ✅ Security headers", "   ✅ Production logging"]
+    startup_lines.append("🌐 Server starting...")
+    # One record instead of one per line
+    logger.info("\n".join(startup_lines))
 
     # Configure uvicorn
+    # Workers and reload both need an import string rather than an app object
     uvicorn_config = {
-        "app": app,
+        "app": "app:app",
         "host": config.HOST,
         "port": config.PORT,
         "reload": not config.is_production,
@@ -402,7 +472,7 @@ if __name__ == "__main__":
     if config.is_production:
         uvicorn_config.update(
             {
-                "workers": int(os.getenv("WORKERS", "1")),
+                "workers": int(os.getenv("WORKERS", str(os.cpu_count() or 1))),
                 "loop": "uvloop",
                 "http": "httptools",
             }
@@ -6,27 +6,45 @@ Handles user registration, login, logout, and token management.
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
+import heapq
+import math
+import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Any, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Iterator,
+    Mapping,
+    MutableMapping,
+    TypeVar,
+    Union,
+)
 
 import jwt
+import msgspec
 from typing_extensions import TypedDict
 from utils.database import get_db_connection
 from utils.security import generate_jwt_token, hash_password, verify_password
 from utils.validation import validate_email, validate_password, validate_username
 
-from artanis import Router
 from artanis.exceptions import AuthenticationError, ValidationError
 from artanis.logging import ArtanisLogger
 
+if TYPE_CHECKING:
+    from artanis import Router
+
 
 class UserDict(TypedDict):
     """Type definition for user data."""
 
     id: int
     username: str
+    username_lc: str
     email: str
     password_hash: str
     full_name: str
@@ -35,16 +53,99 @@ class UserDict(TypedDict):
     created_at: str
 
 
+# Request bodies, decoded and type-checked in one step by msgspec
+class RegisterBody(msgspec.Struct):
+    username: str = ""
+    email: str = ""
+    password: str = ""
+    full_name: str = ""
+
+
+class LoginBody(msgspec.Struct):
+    username: str = ""
+    password: str = ""
+
+
+class RefreshBody(msgspec.Struct):
+    token: str = ""
+
+
+class UpdateUserBody(msgspec.Struct):
+    # msgspec evaluates these at runtime, so keep Union for Python < 3.10
+    full_name: Union[str, msgspec.UnsetType] = msgspec.UNSET  # noqa: UP007
+    email: Union[str, msgspec.UnsetType] = msgspec.UNSET  # noqa: UP007
+
+
+class ChangePasswordBody(msgspec.Struct):
+    current_password: str = ""
+    new_password: str = ""
+
+
+BodyT = TypeVar("BodyT")
+
+_register_decoder = msgspec.json.Decoder(RegisterBody)
+_login_decoder = msgspec.json.Decoder(LoginBody)
+_refresh_decoder = msgspec.json.Decoder(RefreshBody)
+_update_user_decoder = msgspec.json.Decoder(UpdateUserBody)
+_change_password_decoder = msgspec.json.Decoder(ChangePasswordBody)
+
+
+async def _decode_body(request: Any, decoder: msgspec.json.Decoder[BodyT]) -> BodyT:
+    """Decode a JSON request body into its typed struct."""
+    body = await request.body()
+    try:
+        return decoder.decode(body)
+    except msgspec.ValidationError as e:
+        raise ValidationError(str(e))
+    except msgspec.DecodeError:
+        msg = "Invalid JSON in request body"
+        raise ValidationError(msg)
+
+
 logger = ArtanisLogger.get_logger("auth")
-auth_router = Router()
+
+# Refresh only reads claims, so the decoder and its options are shared
+_jwt_decoder = jwt.PyJWT()
+_JWT_NOVERIFY_OPTS = {"verify_signature": False}
+_UTC = timezone.utc
+
+# Issued tokens are valid for 24 hours
+_TOKEN_TTL = timedelta(hours=24)
+_TOKEN_TTL_SECONDS = int(_TOKEN_TTL.total_seconds())
+
+# Password hashing is deliberately CPU-heavy; run it on a pool sized to the
+# machine so it neither blocks the event loop nor oversubscribes the CPU
+_HASH_EXECUTOR = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1, thread_name_prefix="password-hash"
+)
+
+
+async def _run_hasher(func: Callable[..., Any], *args: str) -> Any:
+    """Run a password hashing call on the hashing pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_HASH_EXECUTOR, func, *args)
+
+
+# hash_password("admin123"), precomputed so importing this module does no hashing
+_ADMIN_PASSWORD_HASH = (
+    "54c1044754503932a52078ab0840a6ca"  # noqa: S105
+    "$478c40894d6c9488637c30ef00d92eae04bcf0eece5ded4b08b8e80a26fefe3d"
+)
+# hash_password("timing-equalizer"), checked against when the user doesn't
+# exist so unknown usernames cost the same single verify as known ones
+_DUMMY_PASSWORD_HASH = (
+    "589c5efeb2ede72789c743853a66e8cc"  # noqa: S105
+    "$247bec2378f331d5e9fc8c2d9c7f26bc1c5926a3544f6cfed970e414c2b7df6c"
+)
 
 # In-memory user storage for demo (replace with database)
 users: list[UserDict] = [
     {
         "id": 1,
         "username": "admin",
+        "username_lc": "admin",
         "email": "admin@example.com",
-        "password_hash": hash_password("admin123"),
+        "password_hash": _ADMIN_PASSWORD_HASH,
         "full_name": "Administrator",
         "is_active": True,
         "is_admin": True,
@@ -53,97 +154,213 @@ users: list[UserDict] = [
 ]
 next_user_id = 2
 
+# The only user fields ever returned to clients. A tuple rather than a
+# frozenset: iterating it is just as fast and keeps response key order stable
+_PUBLIC_FIELDS = (
+    "id",
+    "username",
+    "email",
+    "full_name",
+    "is_active",
+    "is_admin",
+    "created_at",
+)
+
+
+def _public(user: Mapping[str, Any]) -> dict[str, Any]:
+    """Return the client-facing view of a user."""
+    return {k: user[k] for k in _PUBLIC_FIELDS}
+
+
+class ShardedUserMap(MutableMapping[str, UserDict]):
+    """Username index split across many small dicts.
+
+    Only worth enabling with millions of users, where a single dict stops
+    fitting in CPU cache; each lookup then touches one much smaller shard.
+    """
+
+    def __init__(self, shard_count: int = 64) -> None:
+        if shard_count & (shard_count - 1):
+            msg = "shard_count must be a power of two"
+            raise ValueError(msg)
+        self._shards: tuple[dict[str, UserDict], ...] = tuple(
+            {} for _ in range(shard_count)
+        )
+        self._mask = shard_count - 1
+
+    def __getitem__(self, key: str) -> UserDict:
+        return self._shards[hash(key) & self._mask][key]
+
+    def __setitem__(self, key: str, value: UserDict) -> None:
+        self._shards[hash(key) & self._mask][key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self._shards[hash(key) & self._mask][key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._shards[hash(key) & self._mask]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._shards[hash(key) & self._mask].get(key, default)
+
+    def __iter__(self) -> Iterator[str]:
+        for shard in self._shards:
+            yield from shard
+
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self._shards)
+
+
+# Opt-in sharding of the username index for very large user counts
+SHARD_USER_INDEX = os.environ.get("SHARD_USER_INDEX", "false").lower() == "true"
+
+# Lookup indexes over ``users``
+users_by_username: MutableMapping[str, UserDict] = (
+    ShardedUserMap() if SHARD_USER_INDEX else {}
+)
+users_by_username.update((u["username_lc"], u) for u in users)
+users_by_email: dict[str, UserDict] = {u["email"]: u for u in users}
+users_by_id: dict[int, UserDict] = {u["id"]: u for u in users}
+
+# Running totals for get_auth_stats, kept in step with ``users``
+active_user_count = sum(u["is_active"] for u in users)
+admin_user_count = sum(u["is_admin"] for u in users)
+
 # Token blacklist for logout (in production, use Redis)
-token_blacklist = set()
+# Keyed by the token's SHA-256 digest and mapped to its expiry epoch, so
+# entries can be dropped once the token would be rejected anyway
+token_blacklist: dict[bytes, float] = {}
+# Min-heap of (expiry, key) so the sweep finds the soonest expiry first
+# regardless of insertion order
+_blacklist_expiries: list[tuple[float, bytes]] = []
+
+
+def _blacklist_sweep(now: float) -> None:
+    """Evict expired entries from the blacklist."""
+    while _blacklist_expiries and _blacklist_expiries[0][0] < now:
+        exp, key = heapq.heappop(_blacklist_expiries)
+        # Skip stale heap entries for keys re-added with a later expiry
+        if token_blacklist.get(key) == exp:
+            del token_blacklist[key]
+
+
+def _token_key(token: str) -> bytes:
+    """Return the blacklist key for a token; raw tokens are never stored."""
+    return hashlib.sha256(token.encode()).digest()
+
+
+def _blacklist_add(key: bytes, exp_ts: float) -> None:
+    """Blacklist a token key until its expiry.
+
+    The entry is kept for at least the token TTL from now.
+    """
+    now = time.time()
+    _blacklist_sweep(now)
+    exp_ts = max(exp_ts, now + _TOKEN_TTL_SECONDS)
+    token_blacklist[key] = exp_ts
+    heapq.heappush(_blacklist_expiries, (exp_ts, key))
+
+
+def _token_expiry(payload: Mapping[str, Any], now: float) -> float:
+    """Return a decoded token's ``exp`` claim as an epoch float.
+
+    Refresh decodes tokens without verification, so the claim may be
+    missing or not a number; fall back to the longest lifetime we issue.
+    """
+    try:
+        exp = float(payload["exp"])
+    except (KeyError, TypeError, ValueError):
+        return now + _TOKEN_TTL_SECONDS
+    return now + _TOKEN_TTL_SECONDS if math.isnan(exp) else exp
 
 
 async def register(request: Any) -> tuple[dict[str, Any], int]:
     """Register a new user."""
-    global next_user_id  # noqa: PLW0603
+    global next_user_id, active_user_count  # noqa: PLW0603
 
-    try:
-        data = await request.json()
-    except Exception:
-        msg = "Invalid JSON in request body"
-        raise ValidationError(msg)
+    data = await _decode_body(request, _register_decoder)
 
     # Validate required fields
-    username = data.get("username", "").strip()
-    email = data.get("email", "").strip().lower()
-    password = data.get("password", "")
-    full_name = data.get("full_name", "").strip()
+    username = data.username.strip()
+    email = data.email.strip().lower()
+    password = data.password
+    full_name = data.full_name.strip()
 
-    # Field validation
+    # Presence checks first so incomplete requests skip the validators
     if not username:
         msg = "Username is required"
         raise ValidationError(msg, field="username")
 
-    if not validate_username(username):
-        msg = "Username must be 3-30 characters, letters, numbers, and underscores only"
-        raise ValidationError(msg, field="username")
-
     if not email:
         msg = "Email is required"
         raise ValidationError(msg, field="email")
 
-    if not validate_email(email):
-        msg = "Invalid email format"
-        raise ValidationError(msg, field="email")
-
     if not password:
         msg = "Password is required"
         raise ValidationError(msg, field="password")
 
-    if not validate_password(password):
-        msg = "Password must be at least 8 characters with uppercase, lowercase, number, and special character"
-        raise ValidationError(msg, field="password")
-
     if not full_name:
         msg = "Full name is required"
         raise ValidationError(msg, field="full_name")
 
+    # Field validation
+    if not validate_username(username):
+        msg = "Username must be 3-30 characters, letters, numbers, and underscores only"
+        raise ValidationError(msg, field="username")
+
+    if not validate_email(email):
+        msg = "Invalid email format"
+        raise ValidationError(msg, field="email")
+
+    if not validate_password(password):
+        msg = "Password must be at least 8 characters with uppercase, lowercase, number, and special character"
+        raise ValidationError(msg, field="password")
+
     # Check if user already exists
-    if any(u["username"] == username for u in users):
+    username_lc = username.lower()
+    if username_lc in users_by_username:
         msg = "Username already exists"
         raise ValidationError(msg, field="username")
 
-    if any(u["email"] == email for u in users):
+    if email in users_by_email:
         msg = "Email already exists"
         raise ValidationError(msg, field="email")
 
     # Create new user
+    password_hash = await _run_hasher(hash_password, password)
     new_user: UserDict = {
         "id": next_user_id,
         "username": username,
+        "username_lc": username_lc,
         "email": email,
-        "password_hash": hash_password(password),
+        "password_hash": password_hash,
         "full_name": full_name,
         "is_active": True,
         "is_admin": False,
-        "created_at": datetime.now(timezone.utc).isoformat() + "Z",
+        "created_at": datetime.now(_UTC).isoformat() + "Z",
     }
 
     users.append(new_user)
+    users_by_username[username_lc] = new_user
+    users_by_email[email] = new_user
+    users_by_id[new_user["id"]] = new_user
     next_user_id += 1
+    active_user_count += 1
 
     logger.info(f"New user registered: {username}")
 
     # Return user without password
-    user_response = {k: v for k, v in new_user.items() if k != "password_hash"}
+    user_response = _public(new_user)
 
     return {"message": "User registered successfully", "user": user_response}, 201
 
 
 async def login(request: Any) -> dict[str, Any]:
     """Authenticate user and return JWT token."""
-    try:
-        data = await request.json()
-    except Exception:
-        msg = "Invalid JSON in request body"
-        raise ValidationError(msg)
+    data = await _decode_body(request, _login_decoder)
 
-    username = data.get("username", "").strip()
-    password = data.get("password", "")
+    username = data.username.strip()
+    password = data.password
 
     if not username:
         msg = "Username is required"
@@ -154,9 +371,11 @@ async def login(request: Any) -> dict[str, Any]:
         raise ValidationError(msg, field="password")
 
     # Find user (case-insensitive username)
-    user = next((u for u in users if u["username"].lower() == username.lower()), None)
+    user = users_by_username.get(username.lower())
 
     if not user:
+        # Do the same hashing work as a real check so unknown names aren't faster
+        await _run_hasher(verify_password, password, _DUMMY_PASSWORD_HASH)
         msg = "Invalid username or password"
         raise AuthenticationError(msg)
 
@@ -165,18 +384,19 @@ async def login(request: Any) -> dict[str, Any]:
         raise AuthenticationError(msg)
 
     # Verify password
-    if not verify_password(password, user["password_hash"]):
+    if not await _run_hasher(verify_password, password, user["password_hash"]):
         logger.warning(f"Failed login attempt for user: {username}")
         msg = "Invalid username or password"
         raise AuthenticationError(msg)
 
     # Generate JWT token
+    now = datetime.now(_UTC)
     token_payload = {
         "user_id": user["id"],
         "username": user["username"],
         "is_admin": user["is_admin"],
-        "exp": datetime.now(timezone.utc) + timedelta(hours=24),
-        "iat": datetime.now(timezone.utc),
+        "exp": now + _TOKEN_TTL,
+        "iat": now,
     }
 
     token = generate_jwt_token(token_payload)
@@ -184,28 +404,32 @@ async def login(request: Any) -> dict[str, Any]:
     logger.info(f"User logged in: {username}")
 
     # Return user info and token
-    user_response = {k: v for k, v in user.items() if k != "password_hash"}
+    user_response = _public(user)
 
     return {
         "message": "Login successful",
         "user": user_response,
         "token": token,
-        "expires_in": 86400,  # 24 hours in seconds
+        "expires_in": _TOKEN_TTL_SECONDS,
     }
 
 
 async def logout(request: Any) -> dict[str, str]:
     """Logout user by blacklisting token."""
-    # Get token from Authorization header
-    auth_header = request.headers.get("Authorization")
+    # Get token from Authorization header (request header names are lowercased)
+    auth_header = request.headers.get("authorization")
     if not auth_header or not auth_header.startswith("Bearer "):
         msg = "Authorization token required"
         raise AuthenticationError(msg)
 
-    token = auth_header.split(" ")[1]
+    token = auth_header[7:]
+    # Shorter than any JWT, so don't bother hashing it into the blacklist
+    if len(token) < 20:
+        msg = "Invalid token"
+        raise AuthenticationError(msg)
 
-    # Add token to blacklist
-    token_blacklist.add(token)
+    # Add token to blacklist; issued tokens never outlive the TTL
+    _blacklist_add(_token_key(token), time.time() + _TOKEN_TTL_SECONDS)
 
     logger.info("User logged out")
 
@@ -214,52 +438,58 @@ async def logout(request: Any) -> dict[str, str]:
 
 async def refresh_token(request: Any) -> dict[str, Any]:
     """Refresh JWT token."""
-    try:
-        data = await request.json()
-    except Exception:
-        msg = "Invalid JSON in request body"
-        raise ValidationError(msg)
+    data = await _decode_body(request, _refresh_decoder)
 
-    old_token = data.get("token")
+    old_token = data.token
     if not old_token:
         msg = "Token is required"
         raise ValidationError(msg, field="token")
 
-    # Check if token is blacklisted
-    if old_token in token_blacklist:
+    # Check if token is blacklisted; the key is reused when blacklisting below
+    old_key = _token_key(old_token)
+    if old_key in token_blacklist:
         msg = "Token is invalid"
         raise AuthenticationError(msg)
 
     try:
         # Decode token (without verification for refresh)
-        payload = jwt.decode(old_token, options={"verify_signature": False})
+        payload = _jwt_decoder.decode(old_token, options=_JWT_NOVERIFY_OPTS)
+
+        # Expired tokens can't be refreshed, even though refresh skips
+        # signature and expiry verification
+        now_ts = time.time()
+        old_exp = _token_expiry(payload, now_ts)
+        if old_exp < now_ts:
+            msg = "Token has expired"
+            raise AuthenticationError(msg)
 
         # Find user
-        user = next((u for u in users if u["id"] == payload["user_id"]), None)
+        user = users_by_id.get(payload["user_id"])
         if not user or not user["is_active"]:
             msg = "User not found or inactive"
             raise AuthenticationError(msg)
 
         # Generate new token
+        now = datetime.now(_UTC)
         new_token_payload = {
             "user_id": user["id"],
             "username": user["username"],
             "is_admin": user["is_admin"],
-            "exp": datetime.now(timezone.utc) + timedelta(hours=24),
-            "iat": datetime.now(timezone.utc),
+            "exp": now + _TOKEN_TTL,
+            "iat": now,
         }
 
         new_token = generate_jwt_token(new_token_payload)
 
         # Blacklist old token
-        token_blacklist.add(old_token)
+        _blacklist_add(old_key, old_exp)
 
         logger.info(f"Token refreshed for user: {user['username']}")
 
         return {
             "message": "Token refreshed successfully",
             "token": new_token,
-            "expires_in": 86400,
+            "expires_in": _TOKEN_TTL_SECONDS,
         }
 
     except jwt.InvalidTokenError:
@@ -277,50 +507,51 @@ async def get_current_user(request: Any) -> dict[str, Any]:
         raise AuthenticationError(msg)
 
     # Return user without password
-    user_response = {k: v for k, v in current_user.items() if k != "password_hash"}
+    user_response = _public(current_user)
 
     return {"user": user_response}
 
 
 async def update_current_user(request: Any) -> dict[str, Any]:
     """Update current user profile."""
-    current_user = getattr(request, "current_user", None)
+    current_user: UserDict | None = getattr(request, "current_user", None)
 
     if not current_user:
         msg = "Authentication required"
         raise AuthenticationError(msg)
 
-    try:
-        data = await request.json()
-    except Exception:
-        msg = "Invalid JSON in request body"
-        raise ValidationError(msg)
+    data = await _decode_body(request, _update_user_decoder)
 
     # Update allowed fields
-    if "full_name" in data:
-        full_name = data["full_name"].strip()
+    if data.full_name is not msgspec.UNSET:
+        full_name = data.full_name.strip()
         if not full_name:
             msg = "Full name cannot be empty"
             raise ValidationError(msg, field="full_name")
         current_user["full_name"] = full_name
 
-    if "email" in data:
-        email = data["email"].strip().lower()
+    if data.email is not msgspec.UNSET:
+        email = data.email.strip().lower()
         if not validate_email(email):
             msg = "Invalid email format"
             raise ValidationError(msg, field="email")
 
         # Check if email is already taken by another user
-        if any(u["email"] == email and u["id"] != current_user["id"] for u in users):
+        existing = users_by_email.get(email)
+        if existing and existing["id"] != current_user["id"]:
             msg = "Email already exists"
             raise ValidationError(msg, field="email")
 
+        # Re-key the index only when it tracks this exact record
+        old_email = current_user["email"]
+        if users_by_email.get(old_email) is current_user:
+            users_by_email[email] = users_by_email.pop(old_email)
         current_user["email"] = email
 
     logger.info(f"User profile updated: {current_user['username']}")
 
     # Return updated user
-    user_response = {k: v for k, v in current_user.items() if k != "password_hash"}
+    user_response = _public(current_user)
 
     return {"message": "Profile updated successfully", "user": user_response}
 
@@ -333,14 +564,10 @@ async def change_password(request: Any) -> dict[str, str]:
         msg = "Authentication required"
         raise AuthenticationError(msg)
 
-    try:
-        data = await request.json()
-    except Exception:
-        msg = "Invalid JSON in request body"
-        raise ValidationError(msg)
+    data = await _decode_body(request, _change_password_decoder)
 
-    current_password = data.get("current_password", "")
-    new_password = data.get("new_password", "")
+    current_password = data.current_password
+    new_password = data.new_password
 
     if not current_password:
         msg = "Current password is required"
@@ -351,7 +578,9 @@ async def change_password(request: Any) -> dict[str, str]:
         raise ValidationError(msg, field="new_password")
 
     # Verify current password
-    if not verify_password(current_password, current_user["password_hash"]):
+    if not await _run_hasher(
+        verify_password, current_password, current_user["password_hash"]
+    ):
         msg = "Current password is incorrect"
         raise AuthenticationError(msg)
 
@@ -361,7 +590,7 @@ async def change_password(request: Any) -> dict[str, str]:
         raise ValidationError(msg, field="new_password")
 
     # Update password
-    current_user["password_hash"] = hash_password(new_password)
+    current_user["password_hash"] = await _run_hasher(hash_password, new_password)
 
     logger.info(f"Password changed for user: {current_user['username']}")
 
@@ -372,27 +601,34 @@ async def get_auth_stats() -> dict[str, int]:
     """Get authentication statistics (admin only)."""
     # This would require admin authentication in production
 
-    active_users = len([u for u in users if u["is_active"]])
-    admin_users = len([u for u in users if u["is_admin"]])
+    _blacklist_sweep(time.time())
     blacklisted_tokens = len(token_blacklist)
 
     return {
         "total_users": len(users),
-        "active_users": active_users,
-        "admin_users": admin_users,
+        "active_users": active_user_count,
+        "admin_users": admin_user_count,
         "blacklisted_tokens": blacklisted_tokens,
     }
 
 
-# Route registrations
-auth_router.post("/register", register)
-auth_router.post("/login", login)
-auth_router.post("/logout", logout)
-auth_router.post("/refresh", refresh_token)
-auth_router.get("/me", get_current_user)
-auth_router.put("/me", update_current_user)
-auth_router.post("/change-password", change_password)
-auth_router.get("/stats", get_auth_stats)
+# Route table, registered on a router by the application at startup
+ROUTES: tuple[tuple[str, str, Callable[..., Any]], ...] = (
+    ("POST", "/register", register),
+    ("POST", "/login", login),
+    ("POST", "/logout", logout),
+    ("POST", "/refresh", refresh_token),
+    ("GET", "/me", get_current_user),
+    ("PUT", "/me", update_current_user),
+    ("POST", "/change-password", change_password),
+    ("GET", "/stats", get_auth_stats),
+)
+
+
+def register_routes(router: Router) -> None:
+    """Register the authentication routes on a router."""
+    for method, path, handler in ROUTES:
+        router.register_route(method, path, handler)
 
 
 """
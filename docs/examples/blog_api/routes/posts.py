@@ -6,18 +6,28 @@ Handles CRUD operations for blog posts, including search, filtering, and file up
 
 from __future__ import annotations
 
+import asyncio
+import bisect
+import functools
+import heapq
+import itertools
+import operator
 import os
+import re
+import shutil
+import sys
 import time
+from collections import Counter
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Optional, Union
+from typing import AbstractSet, Any, Callable, Iterable, Iterator, Optional, Union
 
 from typing_extensions import TypedDict
 from utils.database import get_db_connection
 from utils.security import sanitize_html
 from utils.validation import validate_file_upload, validate_post_data
 
-from artanis import Router
+from artanis import Response, Router
 from artanis.exceptions import AuthenticationError, ValidationError
 from artanis.logging import ArtanisLogger
 
@@ -44,12 +54,34 @@ class PostDict(TypedDict):
     published_at: str | None
 
 
+# Listings carry every field but the post body; clients fetch content per post
+_LISTING_FIELDS = (
+    "id",
+    "title",
+    "slug",
+    "summary",
+    "author_id",
+    "author_username",
+    "category",
+    "tags",
+    "status",
+    "featured_image",
+    "view_count",
+    "like_count",
+    "comment_count",
+    "created_at",
+    "updated_at",
+    "published_at",
+)
+_listing_values = operator.itemgetter(*_LISTING_FIELDS)
+
+
 logger = ArtanisLogger.get_logger("posts")
 posts_router = Router()
 
-# In-memory storage for demo (replace with database)
-posts: list[PostDict] = [
-    {
+# In-memory storage for demo (replace with database), keyed by post id
+posts: dict[int, PostDict] = {
+    1: {
         "id": 1,
         "title": "Welcome to Our Blog",
         "slug": "welcome-to-our-blog",
@@ -68,7 +100,7 @@ posts: list[PostDict] = [
         "updated_at": "2024-01-01T10:00:00Z",
         "published_at": "2024-01-01T10:00:00Z",
     },
-    {
+    2: {
         "id": 2,
         "title": "Getting Started with Artanis",
         "slug": "getting-started-with-artanis",
@@ -87,9 +119,12 @@ posts: list[PostDict] = [
         "updated_at": "2024-01-02T14:30:00Z",
         "published_at": "2024-01-02T14:30:00Z",
     },
-]
+}
 next_post_id = 3
 
+# Lookup by slug, kept in step with ``posts``
+_posts_by_slug: dict[str, PostDict] = {p["slug"]: p for p in posts.values()}
+
 categories = [
     "Technology",
     "Lifestyle",
@@ -99,87 +134,219 @@ categories = [
     "Business",
     "Announcements",
 ]
+_CATEGORY_ERROR = f"Category must be one of: {', '.join(categories)}"
+
+# Uploads are copied to disk in chunks of this size, never read whole
+_UPLOAD_CHUNK_SIZE = 64 * 1024
+_IMAGE_EXTENSIONS = ("jpg", "jpeg", "png", "gif", "webp")
+
+_SLUG_UNSAFE_RE = re.compile(r"[^a-z0-9\s-]")
+_SLUG_SPACES_RE = re.compile(r"\s+")
+
+# Listing indexes over *published* posts, keyed by search token, category, exact
+# tag and author username.  They are kept in step with every write so get_posts
+# intersects a few posting sets instead of scanning every post's text.  The
+# casefolded text each post was tokenized from is cached alongside, as is the
+# set of its casefolded tags.
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_NO_POSTS: frozenset[int] = frozenset()
+
+_search_blobs: dict[int, str] = {}
+_tag_sets: dict[int, frozenset[str]] = {}
+_search_index: dict[str, set[int]] = {}
+_category_index: dict[str, set[int]] = {}
+_tag_index: dict[str, set[int]] = {}
+_author_index: dict[str, set[int]] = {}
+# (created_at, id) of published posts in ascending order, for default listings
+_published_by_created: list[tuple[str, int]] = []
+# Bumped whenever a listing could change; part of the listing cache key
+_posts_version = 0
+
+# Running totals for get_post_stats: engagement summed over published posts
+# and usage of every tag across all posts, drafts included
+_stats_counters: dict[str, int] = {
+    "total_views": 0,
+    "total_likes": 0,
+    "total_comments": 0,
+}
+_tag_usage: Counter[str] = Counter(tag for p in posts.values() for tag in p["tags"])
+
+_SORT_KEYS: dict[str, Callable[[PostDict], Any]] = {
+    "created_at": operator.itemgetter("created_at"),
+    "updated_at": operator.itemgetter("updated_at"),
+    "published_at": lambda p: p["published_at"] or "",
+    "view_count": operator.itemgetter("view_count"),
+    "like_count": operator.itemgetter("like_count"),
+}
+
+
+def _tokenize(text: str) -> set[str]:
+    """Split text into the casefolded alphanumeric tokens used by search."""
+    return set(_TOKEN_RE.findall(text.casefold()))
+
+
+def _search_blob(post: PostDict) -> str:
+    """Build the casefolded searchable text of a post."""
+    tags = " ".join(post["tags"])
+    return f"{post['title']}\n{post['content']}\n{post['summary']}\n{tags}".casefold()
+
+
+def _index_entries(
+    post: PostDict, blob: str
+) -> Iterator[tuple[dict[str, set[int]], str]]:
+    """Yield every (index, key) pair a published post is listed under."""
+    for token in set(_TOKEN_RE.findall(blob)):
+        yield _search_index, token
+    yield _category_index, post["category"]
+    for tag in post["tags"]:
+        yield _tag_index, tag
+    yield _author_index, post["author_username"]
+
+
+def _index_post(post: PostDict) -> None:
+    """Add a post to the listing indexes if it is published."""
+    global _posts_version  # noqa: PLW0603
+    if post["status"] != "published":
+        return
+    _posts_version += 1
+    blob = _search_blobs[post["id"]] = _search_blob(post)
+    _tag_sets[post["id"]] = frozenset(tag.casefold() for tag in post["tags"])
+    for index, key in _index_entries(post, blob):
+        index.setdefault(key, set()).add(post["id"])
+    bisect.insort(_published_by_created, (post["created_at"], post["id"]))
+    _stats_counters["total_views"] += post["view_count"]
+    _stats_counters["total_likes"] += post["like_count"]
+    _stats_counters["total_comments"] += post["comment_count"]
+
+
+def _unindex_post(post: PostDict) -> None:
+    """Remove a post from the listing indexes; call before mutating it."""
+    global _posts_version  # noqa: PLW0603
+    if post["status"] != "published":
+        return
+    _posts_version += 1
+    blob = _search_blobs.pop(post["id"])
+    del _tag_sets[post["id"]]
+    for index, key in _index_entries(post, blob):
+        ids = index.get(key)
+        if ids is not None:
+            ids.discard(post["id"])
+            if not ids:
+                del index[key]
+    entry = (post["created_at"], post["id"])
+    del _published_by_created[bisect.bisect_left(_published_by_created, entry)]
+    _stats_counters["total_views"] -= post["view_count"]
+    _stats_counters["total_likes"] -= post["like_count"]
+    _stats_counters["total_comments"] -= post["comment_count"]
+
+
+def _retag(old_tags: list[str], new_tags: list[str]) -> None:
+    """Move a post's contribution to the tag usage counts to its new tags."""
+    _tag_usage.subtract(old_tags)
+    _tag_usage.update(new_tags)
+    for tag in old_tags:
+        if _tag_usage[tag] <= 0:
+            _tag_usage.pop(tag, None)
+
+
+def _matching_post_ids(
+    search: str, category: str, tag: str, author: str
+) -> set[int] | None:
+    """Intersect the postings for the active filters (None when unfiltered)."""
+    postings: list[AbstractSet[int]] = []
+    phrase = ""
+    if search:
+        # Every search word must appear; a query without words matches nothing
+        tokens = _tokenize(search)
+        postings.extend(_search_index.get(t, _NO_POSTS) for t in tokens)
+        if not tokens:
+            postings.append(_NO_POSTS)
+        elif len(tokens) > 1:
+            phrase = search.casefold()
+    if category:
+        postings.append(_category_index.get(category, _NO_POSTS))
+    if tag:
+        postings.append(_tag_index.get(tag, _NO_POSTS))
+    if author:
+        postings.append(_author_index.get(author, _NO_POSTS))
+    if not postings:
+        return None
+    postings.sort(key=len)
+    matched = set(postings[0]).intersection(*postings[1:])
+    if phrase:
+        # Multi-word searches match as a phrase; a post tagged with exactly
+        # that phrase matches without scanning its cached text
+        matched = {
+            i for i in matched if phrase in _tag_sets[i] or phrase in _search_blobs[i]
+        }
+    return matched
+
+
+for _post in posts.values():
+    _index_post(_post)
+
+
+def utc_now_iso() -> str:
+    """Current UTC time in the timestamp format stored on posts."""
+    return datetime.now(timezone.utc).isoformat() + "Z"
 
 
 def generate_slug(title: str) -> str:
     """Generate URL-friendly slug from title."""
-    import re
-
-    slug = title.lower()
-    slug = re.sub(r"[^a-z0-9\s-]", "", slug)
-    slug = re.sub(r"\s+", "-", slug)
-    return slug.strip("-")
+    slug = _SLUG_UNSAFE_RE.sub("", title.lower())
+    return _SLUG_SPACES_RE.sub("-", slug).strip("-")
 
 
 def get_post_by_id_or_slug(identifier: str) -> PostDict | None:
     """Get post by ID or slug."""
-    # Try ID first
-    try:
-        post_id = int(identifier)
-        return next((p for p in posts if p["id"] == post_id), None)
-    except ValueError:
-        # Try slug
-        return next((p for p in posts if p["slug"] == identifier), None)
+    if identifier.isdecimal():
+        return posts.get(int(identifier))
+    return _posts_by_slug.get(identifier)
+
+
+def _require_post(request: Any, post_id: str) -> tuple[PostDict, dict[str, Any]]:
+    """Resolve a post for an authenticated request, returning it and the user."""
+    current_user = getattr(request, "current_user", None)
+    if not current_user:
+        msg = "Authentication required"
+        raise AuthenticationError(msg)
+
+    post = get_post_by_id_or_slug(post_id)
+    if not post:
+        msg = "Post not found"
+        raise ValidationError(msg)
+
+    return post, current_user
 
 
-async def get_posts(request: Any) -> dict[str, Any]:
+def _require_owned_post(
+    request: Any, post_id: str, action: str
+) -> tuple[PostDict, dict[str, Any]]:
+    """Like _require_post, but the user must own the post or be an admin."""
+    post, current_user = _require_post(request, post_id)
+
+    if post["author_id"] != current_user["id"] and not current_user.get(
+        "is_admin", False
+    ):
+        msg = f"You can only {action} your own posts"
+        raise AuthenticationError(msg)
+
+    return post, current_user
+
+
+async def get_posts(request: Any) -> Response:
     """Get all posts with filtering and search."""
     query_params = request.query_params
 
-    # Start with all published posts
-    filtered_posts = [p for p in posts if p["status"] == "published"]
-
-    # Search filter
     search = query_params.get("search", "").strip()
-    if search:
-        search_lower = search.lower()
-        filtered_posts = [
-            p
-            for p in filtered_posts
-            if search_lower in p["title"].lower()
-            or search_lower in p["content"].lower()
-            or search_lower in p["summary"].lower()
-            or search_lower in " ".join(p["tags"]).lower()
-        ]
-
-    # Category filter
     category = query_params.get("category", "").strip()
-    if category:
-        filtered_posts = [p for p in filtered_posts if p["category"] == category]
-
-    # Tag filter
     tag = query_params.get("tag", "").strip()
-    if tag:
-        filtered_posts = [p for p in filtered_posts if tag in p["tags"]]
-
-    # Author filter
     author = query_params.get("author", "").strip()
-    if author:
-        filtered_posts = [p for p in filtered_posts if p["author_username"] == author]
 
     # Sorting
     sort_by = query_params.get("sort", "created_at")
     sort_order = query_params.get("order", "desc")
 
-    if sort_by in [
-        "created_at",
-        "updated_at",
-        "published_at",
-        "view_count",
-        "like_count",
-    ]:
-        reverse = sort_order == "desc"
-        if sort_by == "created_at":
-            filtered_posts.sort(key=lambda x: x["created_at"], reverse=reverse)
-        elif sort_by == "updated_at":
-            filtered_posts.sort(key=lambda x: x["updated_at"], reverse=reverse)
-        elif sort_by == "published_at":
-            filtered_posts.sort(key=lambda x: x["published_at"] or "", reverse=reverse)
-        elif sort_by == "view_count":
-            filtered_posts.sort(key=lambda x: x["view_count"], reverse=reverse)
-        elif sort_by == "like_count":
-            filtered_posts.sort(key=lambda x: x["like_count"], reverse=reverse)
-
     # Pagination
     try:
         page = int(query_params.get("page", 1))
@@ -188,16 +355,86 @@ async def get_posts(request: Any) -> dict[str, Any]:
         page = 1
         per_page = 10
 
+    return _build_listing(
+        search,
+        category,
+        tag,
+        author,
+        sort_by,
+        sort_order,
+        page,
+        per_page,
+        _posts_version,
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _build_listing(
+    search: str,
+    category: str,
+    tag: str,
+    author: str,
+    sort_by: str,
+    sort_order: str,
+    page: int,
+    per_page: int,
+    version: int,  # noqa: ARG001
+) -> Response:
+    """Filter, sort and paginate published posts for get_posts.
+
+    Results are cached per normalized query as already-encoded responses, so a
+    hit skips JSON encoding too.  ``version`` is the current ``_posts_version``,
+    so a write that can change a listing makes every cached result unreachable;
+    view counts do not bump it and may lag in cached pages.
+    """
+    reverse = sort_order == "desc"
     start_idx = (page - 1) * per_page
-    end_idx = start_idx + per_page
-    paginated_posts = filtered_posts[start_idx:end_idx]
+    end_idx = max(start_idx + per_page, 0)
+    start_idx = max(start_idx, 0)
+
+    # The indexes know how many posts match, so counting needs no pass
+    matched_ids = _matching_post_ids(search, category, tag, author)
+    if matched_ids is None:
+        total_posts = len(_published_by_created)
+    else:
+        total_posts = len(matched_ids)
+
+    if matched_ids is None and sort_by == "created_at":
+        # Unfiltered listings by date page straight off the presorted index
+        if reverse:
+            window = _published_by_created[
+                max(total_posts - end_idx, 0) : max(total_posts - start_idx, 0)
+            ][::-1]
+        else:
+            window = _published_by_created[start_idx:end_idx]
+        paginated_posts = [posts[post_id] for _, post_id in window]
+    else:
+        # Candidates stream lazily and only a sort materializes them; ids
+        # ascend in creation order, which keeps sort ties ordered as before
+        filtered_posts: Iterable[PostDict]
+        if matched_ids is None:
+            filtered_posts = (p for p in posts.values() if p["status"] == "published")
+        else:
+            filtered_posts = (posts[i] for i in sorted(matched_ids))
+
+        sort_key = _SORT_KEYS.get(sort_by)
+        if sort_key is not None and end_idx < total_posts // 2:
+            # Shallow pages only need the leading end_idx posts; the heap
+            # selection matches a stable sort's prefix exactly
+            select = heapq.nlargest if reverse else heapq.nsmallest
+            filtered_posts = select(end_idx, filtered_posts, key=sort_key)
+        elif sort_key is not None:
+            filtered_posts = sorted(filtered_posts, key=sort_key, reverse=reverse)
+
+        paginated_posts = list(itertools.islice(filtered_posts, start_idx, end_idx))
 
     # Calculate pagination metadata
-    total_posts = len(filtered_posts)
     total_pages = (total_posts + per_page - 1) // per_page
 
-    return {
-        "posts": paginated_posts,
+    listing = {
+        "posts": [
+            dict(zip(_LISTING_FIELDS, _listing_values(p))) for p in paginated_posts
+        ],
         "pagination": {
             "page": page,
             "per_page": per_page,
@@ -215,6 +452,9 @@ async def get_posts(request: Any) -> dict[str, Any]:
             "order": sort_order,
         },
     }
+    response = Response()
+    response.json(Response.json_encoder(listing))
+    return response
 
 
 async def get_post(post_id: str) -> dict[str, PostDict]:
@@ -231,6 +471,7 @@ async def get_post(post_id: str) -> dict[str, PostDict]:
 
     # Increment view count
     post["view_count"] += 1
+    _stats_counters["total_views"] += 1
 
     return {"post": post}
 
@@ -250,8 +491,10 @@ async def create_post(request: Any) -> tuple[dict[str, Any], int]:
         msg = "Invalid JSON in request body"
         raise ValidationError(msg)
 
-    # Validate post data
+    # Validate post data; sanitizing is the last await, so the slug picked
+    # below is still free when the post is stored
     validated_data = validate_post_data(data)
+    content = await _clean_post_content(validated_data["content"])
 
     # Generate slug
     slug = generate_slug(validated_data["title"])
@@ -259,34 +502,38 @@ async def create_post(request: Any) -> tuple[dict[str, Any], int]:
     # Ensure slug is unique
     base_slug = slug
     counter = 1
-    while any(p["slug"] == slug for p in posts):
+    while slug in _posts_by_slug:
         slug = f"{base_slug}-{counter}"
         counter += 1
 
     # Create new post
+    now = utc_now_iso()
     new_post: PostDict = {
         "id": next_post_id,
         "title": validated_data["title"],
         "slug": slug,
-        "content": sanitize_html(validated_data["content"]),
+        "content": content,
         "summary": validated_data["summary"],
         "author_id": current_user["id"],
         "author_username": current_user["username"],
-        "category": validated_data["category"],
+        # Category and status come from small fixed sets; interning lets every
+        # post share one string and equality checks hit the identity fast path
+        "category": sys.intern(validated_data["category"]),
         "tags": validated_data["tags"],
-        "status": validated_data.get("status", "draft"),
+        "status": sys.intern(validated_data.get("status", "draft")),
         "featured_image": None,
         "view_count": 0,
         "like_count": 0,
         "comment_count": 0,
-        "created_at": datetime.now(timezone.utc).isoformat() + "Z",
-        "updated_at": datetime.now(timezone.utc).isoformat() + "Z",
-        "published_at": datetime.now(timezone.utc).isoformat() + "Z"
-        if validated_data.get("status") == "published"
-        else None,
+        "created_at": now,
+        "updated_at": now,
+        "published_at": now if validated_data.get("status") == "published" else None,
     }
 
-    posts.append(new_post)
+    posts[new_post["id"]] = new_post
+    _retag([], new_post["tags"])
+    _posts_by_slug[slug] = new_post
+    _index_post(new_post)
     next_post_id += 1
 
     logger.info(f"New post created: {new_post['title']} by {current_user['username']}")
@@ -301,42 +548,53 @@ def _update_post_title(post: PostDict, title: str) -> None:
         raise ValidationError(msg, field="title")
 
     post["title"] = title.strip()
+    _regenerate_slug(post)
 
-    # Regenerate slug if title changed
+
+def _regenerate_slug(post: PostDict) -> None:
+    """Re-derive the post's slug from its title, keeping it unique."""
     new_slug = generate_slug(post["title"])
+    if new_slug == post["slug"]:
+        # Title edits that do not touch the slug need no uniqueness probe
+        return
+
     base_slug = new_slug
     counter = 1
-    while any(p["slug"] == new_slug and p["id"] != post["id"] for p in posts):
+    while new_slug in _posts_by_slug and _posts_by_slug[new_slug] is not post:
         new_slug = f"{base_slug}-{counter}"
         counter += 1
+    del _posts_by_slug[post["slug"]]
     post["slug"] = new_slug
+    _posts_by_slug[new_slug] = post
 
 
-def _update_post_content(post: PostDict, content: str) -> None:
-    """Helper function to update post content."""
+async def _clean_post_content(content: str) -> str:
+    """Helper function to validate post content and sanitize it."""
     if not content.strip():
         msg = "Content cannot be empty"
         raise ValidationError(msg, field="content")
-    post["content"] = sanitize_html(content)
+    # Sanitizing is CPU-bound regex work; run it on a worker thread
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, sanitize_html, content)
 
 
-def _update_post_metadata(post: PostDict, data: dict[str, Any]) -> None:
+def _update_post_metadata(post: PostDict, data: dict[str, Any], now: str) -> None:
     """Helper function to update post metadata fields."""
     if "summary" in data:
         post["summary"] = data["summary"].strip()
 
     if "category" in data:
         if data["category"] not in categories:
-            categories_str = ", ".join(categories)
-            msg = f"Category must be one of: {categories_str}"
-            raise ValidationError(msg, field="category")
-        post["category"] = data["category"]
+            raise ValidationError(_CATEGORY_ERROR, field="category")
+        post["category"] = sys.intern(data["category"])
 
     if "tags" in data:
         if not isinstance(data["tags"], list):
             msg = "Tags must be an array"
             raise ValidationError(msg, field="tags")
-        post["tags"] = [tag.strip() for tag in data["tags"] if tag.strip()]
+        tags = [tag.strip() for tag in data["tags"] if tag.strip()]
+        _retag(post["tags"], tags)
+        post["tags"] = tags
 
     if "status" in data:
         if data["status"] not in ["draft", "published"]:
@@ -344,31 +602,16 @@ def _update_post_metadata(post: PostDict, data: dict[str, Any]) -> None:
             raise ValidationError(msg, field="status")
 
         old_status = post["status"]
-        post["status"] = data["status"]
+        post["status"] = sys.intern(data["status"])
 
         # Set published_at when publishing
         if old_status != "published" and data["status"] == "published":
-            post["published_at"] = datetime.now(timezone.utc).isoformat() + "Z"
+            post["published_at"] = now
 
 
 async def update_post(post_id: str, request: Any) -> dict[str, Any]:
     """Update an existing post (requires authentication and ownership)."""
-    current_user = getattr(request, "current_user", None)
-    if not current_user:
-        msg = "Authentication required"
-        raise AuthenticationError(msg)
-
-    post = get_post_by_id_or_slug(post_id)
-    if not post:
-        msg = "Post not found"
-        raise ValidationError(msg)
-
-    # Check ownership (or admin)
-    if post["author_id"] != current_user["id"] and not current_user.get(
-        "is_admin", False
-    ):
-        msg = "You can only edit your own posts"
-        raise AuthenticationError(msg)
+    post, current_user = _require_owned_post(request, post_id, "edit")
 
     try:
         data = await request.json()
@@ -376,17 +619,29 @@ async def update_post(post_id: str, request: Any) -> dict[str, Any]:
         msg = "Invalid JSON in request body"
         raise ValidationError(msg)
 
-    # Update fields using helper functions
-    if "title" in data:
-        _update_post_title(post, data["title"])
-
+    # Sanitize first: nothing after this awaits, so no other request can see
+    # the post while it is out of the indexes
+    content = None
     if "content" in data:
-        _update_post_content(post, data["content"])
+        content = await _clean_post_content(data["content"])
+
+    # Update fields using helper functions; a failed validation keeps the
+    # fields applied so far, so re-index whatever state the post ends up in
+    now = utc_now_iso()
+    _unindex_post(post)
+    try:
+        if "title" in data:
+            _update_post_title(post, data["title"])
+
+        if content is not None:
+            post["content"] = content
 
-    # Update metadata fields
-    _update_post_metadata(post, data)
+        # Update metadata fields
+        _update_post_metadata(post, data, now)
+    finally:
+        _index_post(post)
 
-    post["updated_at"] = datetime.now(timezone.utc).isoformat() + "Z"
+    post["updated_at"] = now
 
     logger.info(f"Post updated: {post['title']} by {current_user['username']}")
 
@@ -395,26 +650,13 @@ async def update_post(post_id: str, request: Any) -> dict[str, Any]:
 
 async def delete_post(post_id: str, request: Any) -> dict[str, str]:
     """Delete a post (requires authentication and ownership)."""
-    current_user = getattr(request, "current_user", None)
-    if not current_user:
-        msg = "Authentication required"
-        raise AuthenticationError(msg)
-
-    post = get_post_by_id_or_slug(post_id)
-    if not post:
-        msg = "Post not found"
-        raise ValidationError(msg)
-
-    # Check ownership (or admin)
-    if post["author_id"] != current_user["id"] and not current_user.get(
-        "is_admin", False
-    ):
-        msg = "You can only delete your own posts"
-        raise AuthenticationError(msg)
+    post, current_user = _require_owned_post(request, post_id, "delete")
 
     # Remove post
-    global posts  # noqa: PLW0603
-    posts = [p for p in posts if p["id"] != post["id"]]
+    del posts[post["id"]]
+    _retag(post["tags"], [])
+    _unindex_post(post)
+    del _posts_by_slug[post["slug"]]
 
     logger.info(f"Post deleted: {post['title']} by {current_user['username']}")
 
@@ -423,40 +665,41 @@ async def delete_post(post_id: str, request: Any) -> dict[str, str]:
 
 async def like_post(post_id: str, request: Any) -> dict[str, str | int]:
     """Like a post (requires authentication)."""
-    current_user = getattr(request, "current_user", None)
-    if not current_user:
-        msg = "Authentication required"
-        raise AuthenticationError(msg)
-
-    post = get_post_by_id_or_slug(post_id)
-    if not post:
-        msg = "Post not found"
-        raise ValidationError(msg)
+    post, _ = _require_post(request, post_id)
 
     # In a real app, track user likes to prevent duplicates
+    global _posts_version  # noqa: PLW0603
     post["like_count"] += 1
+    _posts_version += 1
+    if post["status"] == "published":
+        _stats_counters["total_likes"] += 1
 
     return {"message": "Post liked successfully", "like_count": post["like_count"]}
 
 
-async def upload_post_image(post_id: str, request: Any) -> dict[str, str]:
-    """Upload featured image for a post."""
-    current_user = getattr(request, "current_user", None)
-    if not current_user:
-        msg = "Authentication required"
-        raise AuthenticationError(msg)
+def _copy_to_path(source: Any, file_path: Path) -> None:
+    """Copy a readable file object to file_path chunk by chunk."""
+    with file_path.open("wb") as f:
+        shutil.copyfileobj(source, f, _UPLOAD_CHUNK_SIZE)
 
-    post = get_post_by_id_or_slug(post_id)
-    if not post:
-        msg = "Post not found"
-        raise ValidationError(msg)
 
-    # Check ownership (or admin)
-    if post["author_id"] != current_user["id"] and not current_user.get(
-        "is_admin", False
-    ):
-        msg = "You can only upload images to your own posts"
-        raise AuthenticationError(msg)
+async def _save_upload(uploaded_file: Any, file_path: Path) -> None:
+    """Stream an uploaded file to disk without holding it in memory."""
+    source = getattr(uploaded_file, "file", None)
+    if source is not None:
+        # Spooled upload: copy the underlying file off the event loop
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, _copy_to_path, source, file_path)
+        return
+
+    with file_path.open("wb") as f:
+        while chunk := await uploaded_file.read(_UPLOAD_CHUNK_SIZE):
+            f.write(chunk)
+
+
+async def upload_post_image(post_id: str, request: Any) -> dict[str, str]:
+    """Upload featured image for a post."""
+    post, _ = _require_owned_post(request, post_id, "upload images to")
 
     # Get uploaded file from request
     # This is a simplified example - in reality, you'd handle multipart/form-data
@@ -469,9 +712,7 @@ async def upload_post_image(post_id: str, request: Any) -> dict[str, str]:
             raise ValidationError(msg)
 
         # Validate file
-        validate_file_upload(
-            uploaded_file, allowed_extensions=["jpg", "jpeg", "png", "gif", "webp"]
-        )
+        validate_file_upload(uploaded_file, allowed_extensions=_IMAGE_EXTENSIONS)
 
         # Save file (simplified)
         upload_dir = Path("uploads/posts")
@@ -480,12 +721,15 @@ async def upload_post_image(post_id: str, request: Any) -> dict[str, str]:
         filename = f"{post['id']}_{int(time.time())}_{uploaded_file.filename}"
         file_path = upload_dir / filename
 
-        with file_path.open("wb") as f:
-            f.write(await uploaded_file.read())
+        await _save_upload(uploaded_file, file_path)
 
         # Update post with image URL
+        global _posts_version  # noqa: PLW0603
         post["featured_image"] = f"/uploads/posts/{filename}"
-        post["updated_at"] = datetime.now(timezone.utc).isoformat() + "Z"
+        post["updated_at"] = utc_now_iso()
+        # Both fields appear in cached listings, and updated_at sorts them
+        if post["status"] == "published":
+            _posts_version += 1
 
         logger.info(f"Image uploaded for post: {post['title']}")
 
@@ -502,15 +746,10 @@ async def upload_post_image(post_id: str, request: Any) -> dict[str, str]:
 
 async def get_categories() -> dict[str, Any]:
     """Get all available categories."""
-    # Count posts per category
-    category_counts: dict[str, int] = {}
-    for post in posts:
-        if post["status"] == "published":
-            category = post["category"]
-            category_counts[category] = category_counts.get(category, 0) + 1
-
+    # The category index holds each category's published posts
     category_list = [
-        {"name": cat, "post_count": category_counts.get(cat, 0)} for cat in categories
+        {"name": cat, "post_count": len(_category_index.get(cat, _NO_POSTS))}
+        for cat in categories
     ]
 
     return {"categories": category_list, "total": len(categories)}
@@ -518,46 +757,41 @@ async def get_categories() -> dict[str, Any]:
 
 async def get_tags() -> dict[str, Any]:
     """Get all tags with usage count."""
-    tag_counts: dict[str, int] = {}
-
-    for post in posts:
-        if post["status"] == "published":
-            for tag in post["tags"]:
-                tag_counts[tag] = tag_counts.get(tag, 0) + 1
+    # The tag index holds each tag's published posts, so counting is per tag;
+    # filling the Counter in name order makes most_common() break ties by name
+    tag_counts = Counter({tag: len(ids) for tag, ids in sorted(_tag_index.items())})
 
     # Sort by usage count
-    sorted_tags = sorted(tag_counts.items(), key=lambda x: x[1], reverse=True)
-
-    tag_list = [{"name": tag, "post_count": count} for tag, count in sorted_tags]
+    tag_list = [
+        {"name": tag, "post_count": count} for tag, count in tag_counts.most_common()
+    ]
 
     return {"tags": tag_list, "total": len(tag_list)}
 
 
 async def get_post_stats() -> dict[str, Any]:
     """Get blog statistics."""
-    published_posts = [p for p in posts if p["status"] == "published"]
-    draft_posts = [p for p in posts if p["status"] == "draft"]
-
-    total_views = sum(p["view_count"] for p in published_posts)
-    total_likes = sum(p["like_count"] for p in published_posts)
-    total_comments = sum(p["comment_count"] for p in published_posts)
+    # Every figure is a running total kept up to date by the write paths;
+    # a post is either published or a draft
+    published_count = len(_published_by_created)
+    total_views = _stats_counters["total_views"]
 
     return {
         "posts": {
             "total": len(posts),
-            "published": len(published_posts),
-            "drafts": len(draft_posts),
+            "published": published_count,
+            "drafts": len(posts) - published_count,
         },
         "engagement": {
             "total_views": total_views,
-            "total_likes": total_likes,
-            "total_comments": total_comments,
-            "avg_views_per_post": total_views / len(published_posts)
-            if published_posts
+            "total_likes": _stats_counters["total_likes"],
+            "total_comments": _stats_counters["total_comments"],
+            "avg_views_per_post": total_views / published_count
+            if published_count
             else 0,
         },
         "categories": len(categories),
-        "tags": len({tag for post in posts for tag in post["tags"]}),
+        "tags": len(_tag_usage),
     }
 
 
@@ -602,7 +836,8 @@ Features:
 10. **Content Sanitization**: HTML cleaning for security
 
 Query Parameters for GET /posts:
-- search: Full-text search
+- search: Full-text search over title, content, summary and tags (whole words;
+  several words match as a phrase)
 - category: Filter by category
 - tag: Filter by tag
 - author: Filter by author
@@ -5,6 +5,7 @@ Security utilities for the blog API.
 from __future__ import annotations
 
 import hashlib
+import hmac
 import os
 import re
 from pathlib import Path
@@ -17,17 +18,38 @@ DEFAULT_DEV_SECRET = "dev-secret-change-in-production"  # noqa: S105
 SECRET_KEY = os.getenv("SECRET_KEY", DEFAULT_DEV_SECRET)
 JWT_ALGORITHM = "HS256"
 
+# Passwords are stored as "<salt hex>$<derived key hex>" using PBKDF2-HMAC-SHA256
+PBKDF2_ITERATIONS = 100_000
+_SALT_BYTES = 16
 
-def hash_password(password: str) -> str:
-    """Hash password using SHA-256 with salt (simplified for demo)."""
-    # In production, use bcrypt or similar
-    salt = "artanis_blog_salt"  # Use random salt per user in production
-    return hashlib.sha256((password + salt).encode()).hexdigest()
+_SCRIPT_TAG_RE = re.compile(r"<script[^>]*>.*?</script>", re.DOTALL | re.IGNORECASE)
+_EVENT_HANDLER_RE = re.compile(r'on\w+\s*=\s*["\'][^"\']*["\']', re.IGNORECASE)
+_UNSAFE_FILENAME_CHARS_RE = re.compile(r"[^a-zA-Z0-9._-]")
+
+
+def _derive_key(password: str, salt: bytes) -> bytes:
+    """Derive the stored key for a password and salt."""
+    return hashlib.pbkdf2_hmac("sha256", password.encode(), salt, PBKDF2_ITERATIONS)
+
+
+def hash_password(password: str, salt: bytes | None = None) -> str:
+    """Hash password with PBKDF2-HMAC-SHA256 and a random per-password salt."""
+    if salt is None:
+        salt = os.urandom(_SALT_BYTES)
+    return f"{salt.hex()}${_derive_key(password, salt).hex()}"
 
 
 def verify_password(password: str, password_hash: str) -> bool:
-    """Verify password against hash."""
-    return hash_password(password) == password_hash
+    """Verify password against a hash produced by hash_password."""
+    salt_hex, _, key_hex = password_hash.partition("$")
+    try:
+        salt = bytes.fromhex(salt_hex)
+        expected = bytes.fromhex(key_hex)
+    except ValueError:
+        return False
+    if not salt or not expected:
+        return False
+    return hmac.compare_digest(_derive_key(password, salt), expected)
 
 
 def generate_jwt_token(payload: dict[str, Any]) -> str:
@@ -46,9 +68,7 @@ def sanitize_html(content: str) -> str:
     # In production, use a proper HTML sanitizer like bleach
 
     # Remove script tags
-    content = re.sub(
-        r"<script[^>]*>.*?</script>", "", content, flags=re.DOTALL | re.IGNORECASE
-    )
+    content = _SCRIPT_TAG_RE.sub("", content)
 
     # Remove dangerous attributes
     # In production, implement proper HTML sanitization with allowlist:
@@ -56,7 +76,7 @@ def sanitize_html(content: str) -> str:
     #                 "h1", "h2", "h3", "h4", "h5", "h6", "blockquote", "code", "pre", "a", "img"]
 
     # Simple tag filtering (in production, use a proper HTML sanitizer)
-    return re.sub(r'on\w+\s*=\s*["\'][^"\']*["\']', "", content, flags=re.IGNORECASE)
+    return _EVENT_HANDLER_RE.sub("", content)
 
 
 def generate_secure_filename(filename: str) -> str:
@@ -66,7 +86,7 @@ def generate_secure_filename(filename: str) -> str:
     filename = file_path.name
 
     # Replace unsafe characters
-    filename = re.sub(r"[^a-zA-Z0-9._-]", "_", filename)
+    filename = _UNSAFE_FILENAME_CHARS_RE.sub("_", filename)
 
     # Limit length
     file_path = Path(filename)
@@ -15,8 +15,9 @@ Run with: python app.py
 from __future__ import annotations
 
 import json
+import secrets
 import time
-import uuid
+from collections import deque
 from typing import Any, Awaitable, Callable, TypedDict, cast
 
 import uvicorn
@@ -38,7 +39,7 @@ class UserData(TypedDict):
 # Helper functions for type-safe request extensions
 def add_request_id(request: Request, request_id: str) -> None:
     """Add request ID to request object in a type-safe way."""
-    object.__setattr__(request, "request_id", request_id)
+    request.request_id = request_id  # type: ignore[attr-defined]
 
 
 def get_request_id(request: Request) -> str:
@@ -48,7 +49,7 @@ def get_request_id(request: Request) -> str:
 
 def add_current_user(request: Request, user_data: UserData) -> None:
     """Add current user data to request object in a type-safe way."""
-    object.__setattr__(request, "current_user", user_data)
+    request.current_user = user_data  # type: ignore[attr-defined]
 
 
 def get_current_user(request: Request) -> UserData | None:
@@ -56,14 +57,29 @@ def get_current_user(request: Request) -> UserData | None:
     user = getattr(request, "current_user", None)
     # Type guard to ensure we return properly typed UserData or None
     if (
-        user
-        and isinstance(user, dict)
-        and all(k in user for k in ["id", "username", "api_key"])
+        isinstance(user, dict)
+        and "id" in user
+        and "username" in user
+        and "api_key" in user
     ):
         return cast("UserData", user)
     return None
 
 
+# Timestamps only have second resolution, so format each second once:
+# (epoch second, formatted timestamp) for the last call
+_last_ts: tuple[int, str] = (0, "")
+
+
+def iso_timestamp() -> str:
+    """Current UTC time as an ISO 8601 string, cached per second."""
+    global _last_ts  # noqa: PLW0603
+    now = int(time.time())
+    if now != _last_ts[0]:
+        _last_ts = (now, time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now)))
+    return _last_ts[1]
+
+
 # Create the application
 app = App()
 
@@ -77,7 +93,7 @@ async def request_id_middleware(
     request: Request, response: Response, call_next: Callable[[], Awaitable[Any]]
 ) -> None:
     """Add unique request ID to each request."""
-    request_id = str(uuid.uuid4())[:8]
+    request_id = secrets.token_hex(4)
 
     # Add to request for use in handlers
     add_request_id(request, request_id)
@@ -107,6 +123,9 @@ async def timing_middleware(
 
 
 # 3. Authentication Middleware
+_PUBLIC_ROUTES = frozenset({"/", "/health", "/public"})
+
+
 async def auth_middleware(
     request: Request, _response: Response, call_next: Callable[[], Awaitable[Any]]
 ) -> None:
@@ -114,8 +133,7 @@ async def auth_middleware(
     path = request.scope.get("path", "")
 
     # Skip auth for public routes
-    public_routes = ["/", "/health", "/public"]
-    if path in public_routes:
+    if path in _PUBLIC_ROUTES:
         await call_next()
         return
 
@@ -138,17 +156,22 @@ async def auth_middleware(
 
 
 # 4. Request Validation Middleware
+_MUTATING_METHODS = frozenset({"POST", "PUT"})
+
+
 async def validation_middleware(
     request: Request, _response: Response, call_next: Callable[[], Awaitable[Any]]
 ) -> None:
     """Validate request format."""
     method = request.scope.get("method", "")
-    content_type = request.headers.get("content-type", "")
 
-    # Validate POST/PUT requests have proper content type
-    if method in ["POST", "PUT"] and not content_type.startswith("application/json"):
-        msg = "Content-Type must be application/json for POST/PUT requests"
-        raise ValidationError(msg)
+    # Validate POST/PUT requests have proper content type; other methods
+    # never look at the header
+    if method in _MUTATING_METHODS:
+        content_type = request.headers.get("content-type", "")
+        if not content_type.startswith("application/json"):
+            msg = "Content-Type must be application/json for POST/PUT requests"
+            raise ValidationError(msg)
 
     await call_next()
 
@@ -220,28 +243,29 @@ async def cors_middleware(
 app.use(cors_middleware)
 
 # 6. Simple Rate Limiting (function-based for demo)
-request_counts: dict[str, list[int]] = {}
+# Per-IP request timestamps, oldest first; never more than the limit
+request_counts: dict[str, deque[int]] = {}
 
 
 async def simple_rate_limit_middleware(
     request: Request, response: Response, call_next: Callable[[], Awaitable[Any]]
 ) -> None:
     """Simple rate limiting middleware."""
-    import time
-
     # Get client IP (simplified)
     client_ip = request.headers.get("x-forwarded-for", "127.0.0.1")
-    current_time = int(time.time())
+    # Monotonic whole seconds: the window cannot jump when the wall clock is reset
+    current_time = time.monotonic_ns() // 1_000_000_000
+
+    timestamps = request_counts.get(client_ip)
+    if timestamps is None:
+        timestamps = request_counts[client_ip] = deque(maxlen=20)
 
-    # Clean old entries (older than 60 seconds)
-    request_counts[client_ip] = [
-        timestamp
-        for timestamp in request_counts.get(client_ip, [])
-        if current_time - timestamp < 60
-    ]
+    # Drop old entries (older than 60 seconds) from the front
+    while timestamps and current_time - timestamps[0] >= 60:
+        timestamps.popleft()
 
     # Check rate limit (20 requests per minute)
-    if len(request_counts.get(client_ip, [])) >= 20:
+    if len(timestamps) >= 20:
         response.set_status(429)
         response.json(
             {
@@ -252,7 +276,7 @@ async def simple_rate_limit_middleware(
         return
 
     # Record this request
-    request_counts.setdefault(client_ip, []).append(current_time)
+    timestamps.append(current_time)
 
     await call_next()
 
@@ -293,7 +317,7 @@ async def health() -> dict[str, Any]:
     """Health check - public route."""
     return {
         "status": "healthy",
-        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "timestamp": iso_timestamp(),
         "middleware": "active",
     }
 
@@ -315,7 +339,7 @@ async def protected_endpoint(request: Request) -> dict[str, Any]:
         "message": "Welcome to the protected area!",
         "user": user,
         "request_id": request_id,
-        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "timestamp": iso_timestamp(),
     }
 
 
@@ -343,7 +367,7 @@ async def create_data(request: Request) -> tuple[dict[str, Any], int]:
             "id": int(time.time()),
             "name": name,
             "created_by": username,
-            "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "created_at": iso_timestamp(),
         },
     }, 201
 
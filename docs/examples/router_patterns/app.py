@@ -55,6 +55,19 @@ comments = [
     {"id": 2, "post_id": 2, "user_id": 1, "content": "I agree, Bob!"},
 ]
 
+# Id lookups, kept in step with the lists above
+_users_by_id = {u["id"]: u for u in users}
+_posts_by_id = {p["id"]: p for p in posts}
+_comments_by_id = {c["id"]: c for c in comments}
+
+# Child records grouped by parent id, in creation order
+_posts_by_user: dict[Any, list[dict[str, Any]]] = {}
+for _post in posts:
+    _posts_by_user.setdefault(_post["user_id"], []).append(_post)
+_comments_by_post: dict[Any, list[dict[str, Any]]] = {}
+for _comment in comments:
+    _comments_by_post.setdefault(_comment["post_id"], []).append(_comment)
+
 next_user_id = 3
 next_post_id = 3
 next_comment_id = 3
@@ -66,17 +79,23 @@ next_comment_id = 3
 
 def find_user(user_id: int) -> dict[str, Any] | None:
     """Find user by ID."""
-    return next((u for u in users if u["id"] == user_id), None)
+    return _users_by_id.get(user_id)
 
 
 def find_post(post_id: int) -> dict[str, Any] | None:
     """Find post by ID."""
-    return next((p for p in posts if p["id"] == post_id), None)
+    return _posts_by_id.get(post_id)
 
 
 def find_comment(comment_id: int) -> dict[str, Any] | None:
     """Find comment by ID."""
-    return next((c for c in comments if c["id"] == comment_id), None)
+    return _comments_by_id.get(comment_id)
+
+
+def _author_name(record: dict[str, Any]) -> str:
+    """Username of a post's or comment's author."""
+    user = find_user(record["user_id"])
+    return user["username"] if user else "Unknown"
 
 
 # ================================
@@ -141,7 +160,7 @@ async def get_user(user_id: str) -> dict[str, Any] | tuple[dict[str, Any], int]:
         return {"error": "User not found"}, 404
 
     # Include user's posts
-    user_posts = [p for p in posts if p["user_id"] == user_id_int]
+    user_posts = _posts_by_user.get(user_id_int, [])
     return {"user": user, "posts": user_posts, "post_count": len(user_posts)}
 
 
@@ -163,6 +182,7 @@ async def create_user(request: Any) -> dict[str, Any] | tuple[dict[str, Any], in
     new_user = {"id": next_user_id, "username": username, "email": email, "posts": []}
 
     users.append(new_user)
+    _users_by_id[new_user["id"]] = new_user
     next_user_id += 1
 
     return {"message": "User created", "user": new_user}, 201
@@ -191,7 +211,7 @@ async def get_user_posts(user_id: str) -> dict[str, Any] | tuple[dict[str, Any],
     if not user:
         return {"error": "User not found"}, 404
 
-    user_posts = [p for p in posts if p["user_id"] == user_id_int]
+    user_posts = _posts_by_user.get(user_id_int, [])
     return {
         "user": {"id": user["id"], "username": user["username"]},
         "posts": user_posts,
@@ -233,6 +253,8 @@ async def create_user_post(
     }
 
     posts.append(new_post)
+    _posts_by_id[new_post["id"]] = new_post
+    _posts_by_user.setdefault(user_id_int, []).append(new_post)
     next_post_id += 1
 
     return {"message": "Post created", "post": new_post}, 201
@@ -250,14 +272,7 @@ posts_router = Router()
 
 async def list_posts() -> dict[str, Any]:
     """List all posts with author info."""
-    enriched_posts = []
-    for post in posts:
-        user_id = post["user_id"]
-        assert isinstance(user_id, int)
-        user = find_user(user_id)
-        enriched_post = post.copy()
-        enriched_post["author"] = user["username"] if user else "Unknown"
-        enriched_posts.append(enriched_post)
+    enriched_posts = [{**post, "author": _author_name(post)} for post in posts]
 
     return {"posts": enriched_posts, "count": len(enriched_posts)}
 
@@ -274,12 +289,10 @@ async def get_post(post_id: str) -> dict[str, Any] | tuple[dict[str, Any], int]:
         return {"error": "Post not found"}, 404
 
     # Get author info
-    user = find_user(post["user_id"])
-    post_with_author = post.copy()
-    post_with_author["author"] = user["username"] if user else "Unknown"
+    post_with_author = {**post, "author": _author_name(post)}
 
     # Get comments
-    post_comments = [c for c in comments if c["post_id"] == post_id_int]
+    post_comments = _comments_by_post.get(post_id_int, [])
 
     return {
         "post": post_with_author,
@@ -311,17 +324,12 @@ async def get_post_comments(
     if not post:
         return {"error": "Post not found"}, 404
 
-    post_comments = [c for c in comments if c["post_id"] == post_id_int]
+    post_comments = _comments_by_post.get(post_id_int, [])
 
     # Enrich with user info
-    enriched_comments = []
-    for comment in post_comments:
-        comment_user_id = comment["user_id"]
-        assert isinstance(comment_user_id, int)
-        user = find_user(comment_user_id)
-        enriched_comment = comment.copy()
-        enriched_comment["author"] = user["username"] if user else "Unknown"
-        enriched_comments.append(enriched_comment)
+    enriched_comments = [
+        {**comment, "author": _author_name(comment)} for comment in post_comments
+    ]
 
     return {
         "post_id": post_id_int,
@@ -357,7 +365,8 @@ async def create_post_comment(
     if not content:
         return {"error": "Content is required"}, 400
 
-    if not user_id or not find_user(user_id):
+    # JSON may hand back a list or object here, which cannot key a dict
+    if not isinstance(user_id, int) or not find_user(user_id):
         return {"error": "Valid user_id is required"}, 400
 
     new_comment = {
@@ -368,6 +377,8 @@ async def create_post_comment(
     }
 
     comments.append(new_comment)
+    _comments_by_id[new_comment["id"]] = new_comment
+    _comments_by_post.setdefault(post_id_int, []).append(new_comment)
     next_comment_id += 1
 
     return {"message": "Comment created", "comment": new_comment}, 201
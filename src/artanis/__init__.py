@@ -84,7 +84,12 @@ from .middleware import (
 from .middleware import (
     MiddlewareExecutor,
     MiddlewareManager,
-    Response,
+)
+from .middleware import (
+    ProductionExceptionHandlerMiddleware as ProductionExceptionHandlerMiddleware,
+)
+from .middleware import (
+    Response as Response,
 )
 from .middleware import (
     ValidationMiddleware as ValidationMiddleware,
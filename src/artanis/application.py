@@ -15,7 +15,7 @@ from .handlers import call_handler
 from .logging import RequestLoggingMiddleware, logger
 from .middleware import MiddlewareExecutor, MiddlewareManager, Response
 from .request import Request
-from .routing import Router
+from .routing import Route, Router, split_path
 
 
 class App:
@@ -319,27 +319,30 @@ class App:
         return self.middleware_manager.path_middleware
 
     def _find_route(
-        self, method: str, path: str
-    ) -> tuple[dict[str, Any] | None, dict[str, str]]:
+        self, method: str, path: str, segments: list[str] | None = None
+    ) -> tuple[Route | None, dict[str, str]]:
         """Find a route handler and extract path parameters.
 
         Args:
             method: HTTP method
             path: Request path
+            segments: The path already split with split_path, if available
 
         Returns:
-            Tuple of (route_info, path_parameters) or (None, {}) if not found
+            Tuple of (route, path_parameters) or (None, {}) if not found
 
         Raises:
             RouteNotFound: If no route matches the path
             MethodNotAllowed: If path exists but method not allowed
         """
-        route, params, source_router = self.router.find_route(method, path)
+        route, params, source_router = self.router.find_route(method, path, segments)
         if route is not None:
-            return route.to_dict(), params
+            return route, params
         return None, {}
 
-    def _path_exists_with_different_method(self, path: str) -> tuple[bool, list[str]]:
+    def _path_exists_with_different_method(
+        self, path: str, segments: list[str] | None = None
+    ) -> tuple[bool, list[str]]:
         """Check if path exists with a different HTTP method.
 
         Used to determine whether to return 405 Method Not Allowed
@@ -347,11 +350,12 @@ class App:
 
         Args:
             path: Request path to check
+            segments: The path already split with split_path, if available
 
         Returns:
             Tuple of (path_exists, allowed_methods)
         """
-        allowed_methods = self.router.get_allowed_methods(path)
+        allowed_methods = self.router.get_allowed_methods(path, segments)
         return len(allowed_methods) > 0, allowed_methods
 
     async def _handle_lifespan(
@@ -372,6 +376,8 @@ class App:
         if message["type"] == "lifespan.startup":
             try:
                 await self.event_manager.execute_startup_handlers()
+                # Startup handlers may register routes, so build afterwards
+                self.router.build()
                 await send({"type": "lifespan.startup.complete"})
             except Exception as e:
                 self.logger.error(f"Startup failed: {e}")
@@ -385,7 +391,86 @@ class App:
                 self.logger.error(f"Shutdown failed: {e}")
                 await send({"type": "lifespan.shutdown.failed", "message": str(e)})
 
-    async def __call__(  # noqa: PLR0915
+    async def _dispatch(
+        self,
+        request: Any,
+        response: Response,
+        route: Route | None,
+        path_params: dict[str, str],
+        segments: list[str],
+    ) -> Response:
+        """Run the matched route handler, or build the 404/405 response.
+
+        This is the final handler at the end of the middleware chain.
+
+        Args:
+            request: Request object passed down the middleware chain
+            response: Response object to fill in
+            route: Matched route, or None if no route matched
+            path_params: Extracted path parameters
+            segments: Request path split by split_path, reused for the
+                405 check when no route matched
+
+        Returns:
+            The response object
+        """
+        if route:
+            try:
+                response_data = await call_handler(route, path_params, request)
+                if not response.is_finished():
+                    # Check if handler has content type hint
+                    handler = route.handler
+                    if isinstance(response_data, Response):
+                        # Handler built its own response, adopt it as-is
+                        response.set_status(response_data.status)
+                        response.headers.update(response_data.headers)
+                        response.body = response_data.body
+                    elif hasattr(handler, "_artanis_content_type"):
+                        content_type = handler._artanis_content_type  # noqa: SLF001
+                        if content_type == "text/html":
+                            response.body = response_data
+                            response.set_header("Content-Type", "text/html")
+                        elif content_type == "application/json":
+                            response.body = response_data
+                            response.set_header("Content-Type", "application/json")
+                        else:
+                            response.json(response_data)
+                    else:
+                        response.json(response_data)
+                return response
+            except HandlerError as e:
+                self.logger.exception(
+                    f"Handler error in {route.method} {route.path}: {e!s}"
+                )
+                if not response.is_finished():
+                    response.set_status(e.status_code)
+                    response.json(e.to_dict())
+                return response
+            except Exception as e:
+                self.logger.exception(
+                    f"Unexpected error in {route.method} {route.path}: {e!s}"
+                )
+                if not response.is_finished():
+                    response.set_status(500)
+                    response.json({"error": "Internal Server Error"})
+                return response
+
+        method = request.scope["method"]
+        path = request.scope["path"]
+        path_exists, allowed_methods = self._path_exists_with_different_method(
+            path, segments
+        )
+        if path_exists:
+            method_error = MethodNotAllowed(path, method, allowed_methods)
+            response.set_status(method_error.status_code)
+            response.json(method_error.to_dict())
+        else:
+            route_error = RouteNotFound(path, method)
+            response.set_status(route_error.status_code)
+            response.json(route_error.to_dict())
+        return response
+
+    async def __call__(
         self,
         scope: dict[str, Any],
         receive: Callable[..., Any],
@@ -393,17 +478,22 @@ class App:
     ) -> None:
         """ASGI application entry point.
 
-        Handles incoming HTTP requests and ASGI lifespan events.
+        Handles incoming HTTP requests and ASGI lifespan events, and rejects
+        WebSocket connections.
 
         Args:
             scope: ASGI scope dictionary
             receive: ASGI receive callable
             send: ASGI send callable
         """
-        if scope["type"] == "lifespan":
-            await self._handle_lifespan(scope, receive, send)
-            return
-        if scope["type"] != "http":
+        scope_type = scope["type"]
+        if scope_type != "http":
+            if scope_type == "lifespan":
+                await self._handle_lifespan(scope, receive, send)
+            elif scope_type == "websocket":
+                # No WebSocket routes; closing before accept makes the
+                # server answer the handshake with 403
+                await send({"type": "websocket.close", "code": 1000})
             return
 
         method = scope["method"]
@@ -413,70 +503,28 @@ class App:
         request = Request(scope, receive)
         response = Response()
 
-        # Find route and extract path params BEFORE middleware execution
-        route, path_params = self._find_route(method, path)
+        # Find route and extract path params BEFORE middleware execution;
+        # a miss reuses the split path for the 405 check
+        segments = split_path(path)
+        route, path_params = self._find_route(method, path, segments)
 
         # Add path params to request for middleware access
         request.path_params = path_params
 
-        # Define the final handler (route handler)
-        async def final_handler(req: Any) -> Any:
-            if route:
-                try:
-                    response_data = await call_handler(
-                        route["handler"], path_params, req, route
-                    )
-                    if not response.is_finished():
-                        # Check if handler has content type hint
-                        handler = route["handler"]
-                        if hasattr(handler, "_artanis_content_type"):
-                            content_type = handler._artanis_content_type  # noqa: SLF001
-                            if content_type == "text/html":
-                                response.body = response_data
-                                response.set_header("Content-Type", "text/html")
-                            elif content_type == "application/json":
-                                response.body = response_data
-                                response.set_header("Content-Type", "application/json")
-                            else:
-                                response.json(response_data)
-                        else:
-                            response.json(response_data)
-                    return response
-                except HandlerError as e:
-                    self.logger.exception(
-                        f"Handler error in {route['method']} {route['path']}: {e!s}"
-                    )
-                    if not response.is_finished():
-                        response.set_status(e.status_code)
-                        response.json(e.to_dict())
-                    return response
-                except Exception as e:
-                    self.logger.exception(
-                        f"Unexpected error in {route['method']} {route['path']}: {e!s}"
+        try:
+            if self.middleware_manager.has_middleware():
+                # The route handler runs at the end of the middleware chain
+                async def final_handler(req: Any) -> Any:
+                    return await self._dispatch(
+                        req, response, route, path_params, segments
                     )
-                    if not response.is_finished():
-                        response.set_status(500)
-                        response.json({"error": "Internal Server Error"})
-                    return response
-            else:
-                path_exists, allowed_methods = self._path_exists_with_different_method(
-                    path
-                )
-                if path_exists:
-                    method_error = MethodNotAllowed(path, method, allowed_methods)
-                    response.set_status(method_error.status_code)
-                    response.json(method_error.to_dict())
-                else:
-                    route_error = RouteNotFound(path, method)
-                    response.set_status(route_error.status_code)
-                    response.json(route_error.to_dict())
-                return response
 
-        try:
-            # Execute middleware chain
-            await self.middleware_executor.execute_with_error_handling(
-                request, response, path, final_handler
-            )
+                await self.middleware_executor.execute_with_error_handling(
+                    request, response, path, final_handler
+                )
+            else:
+                # Nothing to chain through, call the handler directly
+                await self._dispatch(request, response, route, path_params, segments)
 
             # Send response
             await send_response(send, response)
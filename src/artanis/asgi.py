@@ -6,11 +6,14 @@ interface, including JSON responses and error handling.
 
 from __future__ import annotations
 
-import json
-from typing import TYPE_CHECKING, Any, Callable
+from typing import Any, Callable
 
-if TYPE_CHECKING:
-    from .middleware.response import Response
+from .middleware.response import Response
+
+# Header names and values that never change, encoded once
+_CONTENT_TYPE_JSON = (b"content-type", b"application/json")
+_CONTENT_LENGTH = b"content-length"
+_CONTENT_TYPE = b"content-type"
 
 
 async def send_json_response(send: Callable[..., Any], status: int, data: Any) -> None:
@@ -21,15 +24,15 @@ async def send_json_response(send: Callable[..., Any], status: int, data: Any) -
         status: HTTP status code
         data: Data to serialize as JSON
     """
-    response_body = json.dumps(data).encode()
+    response_body = Response.json_encoder(data)
 
     await send(
         {
             "type": "http.response.start",
             "status": status,
             "headers": [
-                [b"content-type", b"application/json"],
-                [b"content-length", str(len(response_body)).encode()],
+                _CONTENT_TYPE_JSON,
+                (_CONTENT_LENGTH, str(len(response_body)).encode()),
             ],
         }
     )
@@ -67,16 +70,17 @@ async def send_response(send: Callable[..., Any], response: Response) -> None:
     # Build headers list, ensuring content-length is set
     headers = response.get_headers_list()
 
+    # Middleware may write to response.headers directly, so scan once for
+    # both headers rather than trusting flags kept by set_header
+    header_names = {name.lower() for name, _ in headers}
+
     # Add content-length if not already set
-    content_length_set = any(name.lower() == b"content-length" for name, _ in headers)
-    if not content_length_set:
-        headers.append((b"content-length", str(len(response_body)).encode()))
+    if _CONTENT_LENGTH not in header_names:
+        headers.append((_CONTENT_LENGTH, str(len(response_body)).encode()))
 
     # Add content-type if not already set and body is JSON
-    content_type_set = any(name.lower() == b"content-type" for name, _ in headers)
-    if not content_type_set and response.body is not None:
-        if isinstance(response.body, (dict, list)):
-            headers.append((b"content-type", b"application/json"))
+    if _CONTENT_TYPE not in header_names and isinstance(response.body, (dict, list)):
+        headers.append(_CONTENT_TYPE_JSON)
 
     await send(
         {
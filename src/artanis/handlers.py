@@ -6,31 +6,29 @@ parameter injection based on function signatures.
 
 from __future__ import annotations
 
-import inspect
-from typing import TYPE_CHECKING, Any, Callable
+from typing import TYPE_CHECKING, Any
 
 from .exceptions import HandlerError
 
 if TYPE_CHECKING:
     from .request import Request
+    from .routing import Route
 
 
 async def call_handler(
-    handler: Callable[..., Any],
+    route: Route,
     path_params: dict[str, str],
     request: Request | None = None,
-    route_info: dict[str, Any] | None = None,
 ) -> Any:
     """Call a route handler with appropriate parameters.
 
-    Inspects the handler signature and provides path parameters and
-    request object as needed.
+    Provides path parameters and the request object according to the
+    handler signature, which the route inspected at registration time.
 
     Args:
-        handler: Route handler function
+        route: Matched route whose handler should be called
         path_params: Extracted path parameters
         request: Request object (optional)
-        route_info: Route information for error context (optional)
 
     Returns:
         Handler response data
@@ -39,25 +37,20 @@ async def call_handler(
         HandlerError: If handler execution fails
     """
     try:
-        sig = inspect.signature(handler)
-        params = list(sig.parameters.keys())
-
         args: list[Any] = []
-        for param in params:
+        for param in route.param_names:
             if param in path_params:
                 args.append(path_params[param])
             elif param == "request" and request:
                 args.append(request)
 
-        if inspect.iscoroutinefunction(handler):
-            return await handler(*args)
-        return handler(*args)
+        if route.is_coroutine:
+            return await route.handler(*args)
+        return route.handler(*args)
     except Exception as e:
-        route_path = route_info.get("path") if route_info else None
-        method = route_info.get("method") if route_info else None
         raise HandlerError(
             message=f"Handler execution failed: {e!s}",
-            route_path=route_path,
-            method=method,
+            route_path=route.path,
+            method=route.method,
             original_error=e,
         )
@@ -7,7 +7,11 @@ exception handling, and comprehensive security features.
 
 from .chain import MiddlewareChain, MiddlewareExecutor
 from .core import MiddlewareManager
-from .exception import ExceptionHandlerMiddleware, ValidationMiddleware
+from .exception import (
+    ExceptionHandlerMiddleware,
+    ProductionExceptionHandlerMiddleware,
+    ValidationMiddleware,
+)
 from .response import Response
 from .security import (
     CORSMiddleware,
@@ -16,6 +20,7 @@ from .security import (
     RateLimitMiddleware,
     SecurityConfig,
     SecurityHeadersMiddleware,
+    TokenBucketRateLimitMiddleware,
 )
 
 __all__ = [
@@ -26,9 +31,11 @@ __all__ = [
     "MiddlewareChain",
     "MiddlewareExecutor",
     "MiddlewareManager",
+    "ProductionExceptionHandlerMiddleware",
     "RateLimitMiddleware",
     "Response",
     "SecurityConfig",
     "SecurityHeadersMiddleware",
+    "TokenBucketRateLimitMiddleware",
     "ValidationMiddleware",
 ]
@@ -141,6 +141,14 @@ class MiddlewareManager:
         path_middleware = self.find_matching_middleware(request_path)
         return self.global_middleware + path_middleware
 
+    def has_middleware(self) -> bool:
+        """Check whether any global or path-based middleware is registered.
+
+        Returns:
+            True if at least one middleware function is registered
+        """
+        return bool(self.global_middleware or self.path_middleware)
+
     def clear(self) -> None:
         """Clear all middleware (useful for testing).
 
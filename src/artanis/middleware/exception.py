@@ -199,6 +199,45 @@ class ExceptionHandlerMiddleware:
             return response
 
 
+class ProductionExceptionHandlerMiddleware(ExceptionHandlerMiddleware):
+    """Exception handling middleware for production deployments.
+
+    Equivalent to ExceptionHandlerMiddleware with debug and traceback output
+    disabled, except that those flags cannot be switched on: errors are always
+    formatted without exception details or stack traces, so internal state is
+    never leaked to clients.
+
+    Args:
+        custom_handlers: Dict mapping exception types to custom handler functions
+    """
+
+    def __init__(
+        self,
+        custom_handlers: dict[type, Callable[..., Awaitable[Response]]] | None = None,
+    ) -> None:
+        super().__init__(custom_handlers=custom_handlers)
+
+    def _format_error_response(
+        self, exception: Exception, request: Any
+    ) -> dict[str, Any]:
+        """Format an exception into a structured error response.
+
+        Args:
+            exception: The exception that occurred
+            request: The request object
+
+        Returns:
+            Dictionary containing structured error information
+        """
+        if isinstance(exception, ArtanisException):
+            return exception.to_dict()
+        return {
+            "error": "Internal Server Error",
+            "error_code": "INTERNAL_ERROR",
+            "status_code": 500,
+        }
+
+
 class ValidationMiddleware:
     """Middleware for request validation.
 
@@ -7,7 +7,12 @@ to build HTTP responses with headers, status codes, and body content.
 from __future__ import annotations
 
 import json
-from typing import Any
+from typing import Any, Callable
+
+
+def _default_json_encoder(data: Any) -> bytes:
+    """Encode data as UTF-8 JSON bytes using the standard library."""
+    return json.dumps(data).encode()
 
 
 class Response:
@@ -22,6 +27,8 @@ class Response:
         headers: Dictionary of response headers
         body: Response body content (JSON, string, or bytes)
         _finished: Internal flag indicating if response is complete
+        json_encoder: Callable used to encode dict/list bodies to bytes,
+            shared by all responses (see set_json_encoder)
 
     Example:
         ```python
@@ -32,12 +39,32 @@ class Response:
         ```
     """
 
+    __slots__ = ("_finished", "body", "headers", "status")
+
+    json_encoder: Callable[[Any], bytes] = staticmethod(_default_json_encoder)
+
     def __init__(self) -> None:
         self.status: int = 200
         self.headers: dict[str, str] = {}
         self.body: Any = None
         self._finished: bool = False
 
+    @classmethod
+    def set_json_encoder(cls, encoder: Callable[[Any], bytes]) -> None:
+        """Set the JSON encoder used for all responses.
+
+        Args:
+            encoder: Callable that takes JSON-serializable data and returns bytes
+
+        Example:
+            ```python
+            import orjson
+
+            Response.set_json_encoder(orjson.dumps)
+            ```
+        """
+        cls.json_encoder = staticmethod(encoder)
+
     def json(self, data: Any) -> None:
         """Set response body as JSON data.
 
@@ -108,7 +135,7 @@ class Response:
             return b""
 
         if isinstance(self.body, (dict, list)):
-            return json.dumps(self.body).encode()
+            return self.json_encoder(self.body)
         if isinstance(self.body, str):
             return self.body.encode()
         if isinstance(self.body, bytes):
@@ -7,7 +7,9 @@ application security and follow web security best practices.
 
 from __future__ import annotations
 
+import math
 import time
+from collections import OrderedDict
 from typing import Any, Callable
 from urllib.parse import urlparse
 
@@ -678,3 +680,122 @@ class RateLimitMiddleware:
             if entry_window_start < window_start:
                 # Reset counter for new window
                 self._storage[key] = {"count": 0, "window_start": time.time()}
+
+
+class TokenBucketRateLimitMiddleware(RateLimitMiddleware):
+    """Token bucket rate limiting middleware.
+
+    Drop-in alternative to RateLimitMiddleware that refills each client's
+    allowance continuously instead of resetting it at fixed window boundaries.
+    Every key stores only its token count and last refill time, so each check
+    is constant time, and the least recently seen keys are evicted once
+    max_keys is reached to keep memory bounded.
+    """
+
+    def __init__(
+        self,
+        requests_per_window: int = 100,
+        window_seconds: int = 3600,
+        storage: str = "memory",
+        key_function: Callable[[Any], str] | None = None,
+        skip_successful_requests: bool = False,
+        max_keys: int = 10000,
+    ) -> None:
+        """Initialize token bucket rate limit middleware.
+
+        Args:
+            requests_per_window: Bucket capacity (maximum burst size)
+            window_seconds: Time to refill an empty bucket completely
+            storage: Storage backend ("memory" or "redis")
+            key_function: Function to generate rate limit key
+            skip_successful_requests: Only count failed requests
+            max_keys: Maximum number of tracked keys before LRU eviction
+        """
+        super().__init__(
+            requests_per_window=requests_per_window,
+            window_seconds=window_seconds,
+            storage=storage,
+            key_function=key_function,
+            skip_successful_requests=skip_successful_requests,
+        )
+        self.max_keys = max_keys
+        self.refill_rate = requests_per_window / window_seconds
+
+        # key -> (tokens, last_refill), ordered from least to most recently used
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+    def _get_tokens(self, key: str) -> float:
+        """Get the number of tokens currently available for key.
+
+        Args:
+            key: Rate limit key
+
+        Returns:
+            Available tokens after refilling for the elapsed time
+        """
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            return float(self.requests_per_window)
+
+        tokens, last_refill = bucket
+        elapsed = time.monotonic() - last_refill
+        return min(float(self.requests_per_window), tokens + elapsed * self.refill_rate)
+
+    def _is_allowed(self, key: str) -> bool:
+        """Check if request is allowed under rate limit.
+
+        Args:
+            key: Rate limit key
+
+        Returns:
+            True if at least one token is available
+        """
+        return self._get_tokens(key) >= 1
+
+    def _increment_counter(self, key: str) -> None:
+        """Consume one token for key.
+
+        Args:
+            key: Rate limit key
+        """
+        tokens = max(0.0, self._get_tokens(key) - 1)
+        self._buckets[key] = (tokens, time.monotonic())
+        self._buckets.move_to_end(key)
+
+        if len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+
+    def _get_remaining_requests(self, key: str) -> int:
+        """Get remaining requests for key.
+
+        Args:
+            key: Rate limit key
+
+        Returns:
+            Number of whole tokens left in the bucket
+        """
+        return int(self._get_tokens(key))
+
+    def _get_reset_time(self, key: str) -> float:
+        """Get the time at which the bucket is full again.
+
+        Args:
+            key: Rate limit key
+
+        Returns:
+            Unix timestamp of full refill
+        """
+        missing = self.requests_per_window - self._get_tokens(key)
+        return time.time() + missing / self.refill_rate
+
+    def _get_retry_after(self, key: str) -> int:
+        """Get retry after seconds.
+
+        Args:
+            key: Rate limit key
+
+        Returns:
+            Seconds until the next token is available
+        """
+        missing = 1 - self._get_tokens(key)
+        return max(1, math.ceil(missing / self.refill_rate))
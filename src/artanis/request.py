@@ -6,6 +6,7 @@ Artanis ASGI web framework, including body parsing and header processing.
 
 from __future__ import annotations
 
+import functools
 import json
 from typing import Any, Awaitable, Callable
 
@@ -27,9 +28,14 @@ class Request:
         scope: The ASGI scope dictionary
         receive: The ASGI receive callable
         path_params: Dictionary of extracted path parameters
-        headers: Dictionary of request headers
+        headers: Dictionary of request headers with lowercased names,
+            built from the scope on first access
+        json_decoder: Callable used to decode JSON request bodies,
+            shared by all requests (see set_json_decoder)
     """
 
+    json_decoder: Callable[[bytes], Any] = staticmethod(json.loads)
+
     def __init__(
         self, scope: dict[str, Any], receive: Callable[[], Awaitable[dict[str, Any]]]
     ) -> None:
@@ -39,12 +45,63 @@ class Request:
         self.path_params: dict[
             str, str
         ] = {}  # For middleware access to path parameters
+
+    @functools.cached_property
+    def headers(self) -> dict[str, str]:
+        """Request headers as a dictionary keyed by lowercased name.
+
+        Built from the raw ASGI header list the first time it is accessed,
+        so requests whose handlers never read headers don't pay for it.
+        """
         # Convert ASGI headers (list of byte tuples) to string dict
-        raw_headers = scope.get("headers", [])
-        self.headers: dict[str, str] = {
-            name.decode().lower(): value.decode() for name, value in raw_headers
+        return {
+            name.decode().lower(): value.decode()
+            for name, value in self.scope.get("headers", [])
         }
 
+    def get_header(self, name: str, default: str | None = None) -> str | None:
+        """Get a single request header without building the headers dict.
+
+        Scans the raw ASGI header list, which is cheaper than a dict for the
+        handful of headers a typical request carries.  Once ``headers`` has
+        been built it is used instead.
+
+        Args:
+            name: Header name (case-insensitive)
+            default: Value returned if the header is missing
+
+        Returns:
+            The header value, or ``default`` if the header is missing
+        """
+        if "headers" in self.__dict__:
+            return self.headers.get(name.lower(), default)
+        # Like the dict, a repeated header resolves to its last value
+        needle = name.lower().encode("latin-1")
+        found: bytes | None = None
+        for header_name, value in self.scope.get("headers", []):
+            if header_name.lower() == needle:
+                found = value
+        return default if found is None else found.decode()
+
+    @classmethod
+    def set_json_decoder(cls, decoder: Callable[[bytes], Any]) -> None:
+        """Set the JSON decoder used for all request bodies.
+
+        The decoder must accept bytes and raise ``ValueError`` (or a subclass
+        such as ``json.JSONDecodeError``) on malformed input.
+
+        Args:
+            decoder: Callable that takes the raw body bytes and returns data
+
+        Example:
+            ```python
+            import orjson
+
+            Request.set_json_decoder(orjson.loads)
+            ```
+        """
+        cls.json_decoder = staticmethod(decoder)
+
     async def body(self) -> bytes:
         """Get the request body as bytes.
 
@@ -55,14 +112,24 @@ class Request:
             The complete request body as bytes
         """
         if self._body is None:
-            body_parts = []
+            buffer: bytearray | None = None
             while True:
                 message = await self.receive()
-                if message["type"] == "http.request":
-                    body_parts.append(message.get("body", b""))
-                    if not message.get("more_body", False):
+                if message["type"] != "http.request":
+                    continue
+                chunk = message.get("body", b"")
+                more_body = message.get("more_body", False)
+                if buffer is None:
+                    # Most bodies arrive in a single message, use it as-is
+                    if not more_body:
+                        self._body = chunk
+                        break
+                    buffer = bytearray(chunk)
+                else:
+                    buffer.extend(chunk)
+                    if not more_body:
+                        self._body = bytes(buffer)
                         break
-            self._body = b"".join(body_parts)
         return self._body
 
     async def json(self) -> Any:
@@ -76,13 +143,14 @@ class Request:
         Raises:
             ValidationError: If the body is not valid JSON
         """
+        body = await self.body()
         try:
-            body = await self.body()
-            return json.loads(body.decode())
-        except json.JSONDecodeError as e:
+            return self.json_decoder(body)
+        except ValueError as e:
+            text = body.decode(errors="replace")
             raise ValidationError(
                 message="Invalid JSON in request body",
                 field="body",
-                value=body.decode() if len(body) < 200 else body.decode()[:200] + "...",
+                value=text if len(text) < 200 else text[:200] + "...",
                 validation_errors={"json_error": str(e)},
             )
@@ -7,8 +7,9 @@ organization and modularity.
 
 from __future__ import annotations
 
+import inspect
 import re
-from typing import Any, Callable, Pattern
+from typing import Any, Callable, Iterator, Pattern
 
 from .exceptions import MethodNotAllowed, RouteNotFound
 from .logging import logger
@@ -29,8 +30,20 @@ class Route:
         handler: Route handler function
         pattern: Compiled regex pattern for path matching
         middleware: Route-specific middleware
+        param_names: Handler parameter names, in signature order
+        is_coroutine: Whether the handler is an async function
     """
 
+    __slots__ = (
+        "handler",
+        "is_coroutine",
+        "method",
+        "middleware",
+        "param_names",
+        "path",
+        "pattern",
+    )
+
     def __init__(
         self,
         method: str,
@@ -43,6 +56,9 @@ class Route:
         self.handler = handler
         self.pattern = self._compile_path_pattern(path)
         self.middleware = middleware or []
+        # Inspected once here rather than on every request
+        self.param_names = tuple(inspect.signature(handler).parameters)
+        self.is_coroutine = inspect.iscoroutinefunction(handler)
 
     def _compile_path_pattern(self, path: str) -> Pattern[str]:
         """Compile a path pattern into a regular expression.
@@ -87,6 +103,82 @@ class Route:
         }
 
 
+class _TrieNode:
+    """One path segment in a router's route lookup trie.
+
+    Children are tried in precedence order: an exact static segment first,
+    then whole-segment parameters (``{id}``), then segments that mix text
+    and parameters (``{name}.json``).
+
+    Parameter names are not stored on the nodes: a lookup only collects
+    parameter values, and each route entry carries the names to pair them
+    with.  That lets every ``{name}`` segment share a single child node.
+
+    Attributes:
+        static: Child nodes keyed by literal segment text
+        param: Child node for whole-segment parameters, if any
+        patterns: ``(segment, compiled_regex, node)`` triples for mixed segments
+        routes: ``(route, source_router, param_names)`` entries ending here,
+            keyed by method
+    """
+
+    def __init__(self) -> None:
+        self.static: dict[str, _TrieNode] = {}
+        self.param: _TrieNode | None = None
+        self.patterns: list[tuple[str, Pattern[str], _TrieNode]] = []
+        self.routes: dict[str, tuple[Route, Router, tuple[str, ...]]] = {}
+
+    def child(self, segment: str, param_names: list[str]) -> _TrieNode:
+        """Get or create the child node for a route path segment.
+
+        Args:
+            segment: One '/'-delimited segment of a route path pattern
+            param_names: Parameter names seen so far along the route path,
+                extended with any this segment declares (mutated)
+
+        Returns:
+            The child node for that segment
+        """
+        if "{" not in segment:
+            node = self.static.get(segment)
+            if node is None:
+                node = self.static[segment] = _TrieNode()
+            return node
+
+        if segment[0] == "{" and segment[-1] == "}" and segment.count("{") == 1:
+            param_names.append(segment[1:-1])
+            if self.param is None:
+                self.param = _TrieNode()
+            return self.param
+
+        for pattern_segment, pattern, node in self.patterns:
+            if pattern_segment == segment:
+                param_names.extend(pattern.groupindex)
+                return node
+        escaped = re.escape(segment)
+        escaped = escaped.replace(r"\{", "(?P<").replace(r"\}", r">[^/]+)")
+        pattern = re.compile(escaped)
+        param_names.extend(pattern.groupindex)
+        node = _TrieNode()
+        self.patterns.append((segment, pattern, node))
+        return node
+
+
+def split_path(path: str) -> list[str]:
+    """Split a path into its segments, keeping empty ones.
+
+    '/' gives [''], '/users' gives ['users'] and '/users/' gives ['users', ''],
+    so a trailing slash stays significant.
+
+    Args:
+        path: URL path starting with '/'
+
+    Returns:
+        List of path segments
+    """
+    return path[1:].split("/")
+
+
 class Router:
     """Router class for handling route registration and resolution.
 
@@ -102,11 +194,17 @@ class Router:
         subrouters: Dictionary of mounted subrouters
     """
 
+    # Bumped by every registration or mount on any router, so a parent's
+    # trie also notices routes added to an already-mounted subrouter
+    _generation = 0
+
     def __init__(self, prefix: str = "") -> None:
         self.prefix = prefix.rstrip("/")
         self.routes: dict[str, dict[str, Route]] = {}
         self.subrouters: dict[str, Router] = {}
         self.logger = logger
+        self._trie: _TrieNode | None = None
+        self._trie_generation = -1
 
     def register_route(
         self,
@@ -131,6 +229,7 @@ class Router:
 
         route = Route(method, full_path, handler, middleware)
         self.routes[full_path][method.upper()] = route
+        Router._generation += 1
 
         self.logger.debug(f"Registered {method.upper()} route: {full_path}")
 
@@ -290,121 +389,191 @@ class Router:
 
         # Store subrouter
         self.subrouters[normalized_path] = router
+        Router._generation += 1
 
         self.logger.debug(f"Mounted subrouter at: {normalized_path}")
 
+    def _iter_routes(self) -> Iterator[tuple[str, Route, Router]]:
+        """Yield every reachable route with its full path, in priority order.
+
+        Direct routes come first, then each subrouter's routes (in mount
+        order) with the mount path prepended.  A subrouter's root route is
+        reachable both with and without the trailing slash.
+
+        Yields:
+            Tuples of (full_path, route, source_router)
+        """
+        for methods in self.routes.values():
+            for route in methods.values():
+                yield route.path, route, self
+
+        for mount_path, subrouter in self.subrouters.items():
+            base = mount_path.rstrip("/")
+            for sub_path, route, source_router in subrouter._iter_routes():  # noqa: SLF001
+                yield base + sub_path, route, source_router
+                if sub_path == "/":
+                    yield base or "/", route, source_router
+
+    def _get_trie(self) -> _TrieNode:
+        """Get the lookup trie, rebuilding it if any router changed.
+
+        Mounted subrouters are flattened into this router's trie, so a
+        lookup never recurses across routers.
+
+        Returns:
+            Root node of the route trie
+        """
+        if self._trie is None or self._trie_generation != Router._generation:
+            root = _TrieNode()
+            for path, route, source_router in self._iter_routes():
+                node = root
+                param_names: list[str] = []
+                for segment in split_path(path):
+                    node = node.child(segment, param_names)
+                # Earlier (higher priority) registrations win on conflicts
+                node.routes.setdefault(
+                    route.method, (route, source_router, tuple(param_names))
+                )
+            self._trie = root
+            self._trie_generation = Router._generation
+        return self._trie
+
+    def build(self) -> None:
+        """Flatten this router and its mounted subrouters into the lookup trie.
+
+        Optional: the trie is otherwise built by the first lookup.  Calling
+        this at startup keeps that cost off the first request.  Routes
+        registered afterwards still trigger a rebuild on the next lookup.
+        """
+        self._get_trie()
+
+    def _match(
+        self,
+        node: _TrieNode,
+        segments: list[str],
+        index: int,
+        method: str,
+        values: list[str],
+    ) -> tuple[Route, Router, tuple[str, ...]] | None:
+        """Depth-first search for the first route matching path and method.
+
+        Args:
+            node: Trie node matched so far
+            segments: Request path segments
+            index: Index of the next segment to match
+            method: HTTP method the route must handle
+            values: Path parameter values captured on the way down (mutated)
+
+        Returns:
+            The matching (route, source_router, param_names) entry, or None
+        """
+        if index == len(segments):
+            return node.routes.get(method)
+
+        segment = segments[index]
+        child = node.static.get(segment)
+        if child is not None:
+            found = self._match(child, segments, index + 1, method, values)
+            if found is not None:
+                return found
+
+        # Parameters never match an empty segment
+        if not segment:
+            return None
+
+        child = node.param
+        if child is not None:
+            values.append(segment)
+            found = self._match(child, segments, index + 1, method, values)
+            if found is not None:
+                return found
+            values.pop()
+
+        for _, pattern, child in node.patterns:
+            match = pattern.fullmatch(segment)
+            if match is None:
+                continue
+            groups = match.groups()
+            values.extend(groups)
+            found = self._match(child, segments, index + 1, method, values)
+            if found is not None:
+                return found
+            del values[-len(groups) :]
+
+        return None
+
     def find_route(
-        self, method: str, path: str
+        self, method: str, path: str, segments: list[str] | None = None
     ) -> tuple[Route | None, dict[str, str], Router | None]:
         """Find a route handler and extract path parameters.
 
+        Walks the route trie one path segment at a time, preferring static
+        segments over parameters.
+
         Args:
             method: HTTP method
             path: Request path
+            segments: The path already split with split_path, if available
 
         Returns:
             Tuple of (route, path_parameters, source_router) or (None, {}, None) if not found
         """
-        method = method.upper()
+        if segments is None:
+            segments = split_path(path)
+        values: list[str] = []
+        found = self._match(self._get_trie(), segments, 0, method.upper(), values)
+        if found is None:
+            return None, {}, None
+        route, source_router, param_names = found
+        return route, dict(zip(param_names, values)), source_router
+
+    def _collect_methods(
+        self, node: _TrieNode, segments: list[str], index: int, methods: set[str]
+    ) -> None:
+        """Add the methods of every route matching the path to ``methods``.
 
-        # First, try direct routes in this router
-        for methods in self.routes.values():
-            if method in methods:
-                route = methods[method]
-                params = route.match(path)
-                if params is not None:
-                    return route, params, self
+        Args:
+            node: Trie node matched so far
+            segments: Request path segments
+            index: Index of the next segment to match
+            methods: Set collecting allowed methods (mutated)
+        """
+        if index == len(segments):
+            methods.update(node.routes)
+            return
 
-        # Then, try subrouters
-        for mount_path, subrouter in self.subrouters.items():
-            if "{" in mount_path:
-                # Handle parameterized mount paths
-                mount_route = Route("GET", mount_path, lambda: None)
-
-                # Try to match the mount pattern against the beginning of the path
-                # We need to check if the path can be split into mount + sub parts
-                mount_pattern = mount_route.pattern.pattern
-                # Remove only the start ^ and end $ anchors, not ^ inside character classes
-                if mount_pattern.startswith("^"):
-                    partial_pattern = mount_pattern[1:]
-                else:
-                    partial_pattern = mount_pattern
-                if partial_pattern.endswith("$"):
-                    partial_pattern = partial_pattern[:-1]
-
-                import re
-
-                # Try to match from start of path
-                match = re.match(partial_pattern, path)
-                if match:
-                    mount_params = match.groupdict()
-                    matched_length = match.end()
-
-                    # Extract remaining path for subrouter
-                    sub_path = path[matched_length:]
-                    if not sub_path:
-                        sub_path = "/"
-                    elif not sub_path.startswith("/"):
-                        sub_path = "/" + sub_path
-
-                    # Recursively search in subrouter
-                    sub_route, sub_params, source_router = subrouter.find_route(
-                        method, sub_path
-                    )
-                    if sub_route is not None:
-                        # Merge mount parameters with subroute parameters
-                        all_params = {**mount_params, **sub_params}
-                        return sub_route, all_params, source_router
-            # Simple mount path (no parameters)
-            elif path.startswith(mount_path):
-                if mount_path == "/":
-                    sub_path = path
-                else:
-                    sub_path = path[len(mount_path) :]
-                    if not sub_path:
-                        sub_path = "/"
-                    elif not sub_path.startswith("/"):
-                        sub_path = "/" + sub_path
-
-                # Recursively search in subrouter
-                sub_route, sub_params, source_router = subrouter.find_route(
-                    method, sub_path
-                )
-                if sub_route is not None:
-                    return sub_route, sub_params, source_router
+        segment = segments[index]
+        child = node.static.get(segment)
+        if child is not None:
+            self._collect_methods(child, segments, index + 1, methods)
+
+        if not segment:
+            return
 
-        return None, {}, None
+        if node.param is not None:
+            self._collect_methods(node.param, segments, index + 1, methods)
 
-    def get_allowed_methods(self, path: str) -> list[str]:
+        for _, pattern, child in node.patterns:
+            if pattern.fullmatch(segment) is not None:
+                self._collect_methods(child, segments, index + 1, methods)
+
+    def get_allowed_methods(
+        self, path: str, segments: list[str] | None = None
+    ) -> list[str]:
         """Get allowed HTTP methods for a given path.
 
         Args:
             path: Request path
+            segments: The path already split with split_path, if available
 
         Returns:
             List of allowed HTTP methods
         """
-        allowed_methods = []
-
-        # Check direct routes
-        for methods in self.routes.values():
-            for route in methods.values():
-                if route.match(path) is not None:
-                    allowed_methods.append(route.method)
-
-        # Check subrouters
-        for mount_path, subrouter in self.subrouters.items():
-            if path.startswith(mount_path):
-                if mount_path == "/":
-                    sub_path = path
-                else:
-                    sub_path = path[len(mount_path) :]
-                    if not sub_path.startswith("/"):
-                        sub_path = "/" + sub_path
-
-                allowed_methods.extend(subrouter.get_allowed_methods(sub_path))
-
-        return list(set(allowed_methods))  # Remove duplicates
+        if segments is None:
+            segments = split_path(path)
+        methods: set[str] = set()
+        self._collect_methods(self._get_trie(), segments, 0, methods)
+        return list(methods)
 
     def get_all_routes(self) -> list[dict[str, Any]]:
         """Get all routes from this router and subrouters.
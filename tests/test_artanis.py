@@ -172,6 +172,37 @@ class TestASGIFramework:
         assert len(status_calls) > 0
         assert status_calls[0][0][0]["status"] == 405
 
+    @pytest.mark.asyncio
+    async def test_handler_returning_response_object(self):
+        """Test that a Response returned by a handler is sent without re-encoding"""
+        from artanis import App, Response
+
+        app = App()
+
+        prebuilt = Response()
+        prebuilt.set_status(201)
+        prebuilt.set_header("Content-Type", "application/json")
+        prebuilt.body = b'{"cached": true}'
+
+        async def cached_handler():
+            return prebuilt
+
+        app.get("/cached", cached_handler)
+
+        scope = {"type": "http", "method": "GET", "path": "/cached", "headers": []}
+        receive = AsyncMock()
+        send = AsyncMock()
+
+        await app(scope, receive, send)
+
+        start = send.call_args_list[0][0][0]
+        body = send.call_args_list[1][0][0]
+        assert start["status"] == 201
+        assert (b"Content-Type", b"application/json") in start["headers"]
+        assert body["body"] == b'{"cached": true}'
+        # The shared Response must not be mutated by the request lifecycle
+        assert prebuilt.headers == {"Content-Type": "application/json"}
+
     def test_route_with_path_parameters(self):
         """Test registering routes with path parameters"""
         from artanis import App
@@ -276,6 +307,88 @@ class TestASGIFramework:
         assert len(status_calls) > 0
         assert status_calls[0][0][0]["status"] == 200
 
+    @pytest.mark.asyncio
+    async def test_custom_json_decoder(self):
+        """Test that Request.set_json_decoder changes how bodies are parsed"""
+        from artanis import App, Request
+
+        app = App()
+        seen = []
+
+        async def create_user_handler(request):
+            seen.append(await request.json())
+            return {"ok": True}
+
+        app.post("/users", create_user_handler)
+
+        scope = {"type": "http", "method": "POST", "path": "/users", "headers": []}
+        receive = AsyncMock()
+        receive.side_effect = [
+            {"type": "http.request", "body": b"raw", "more_body": False}
+        ]
+        send = AsyncMock()
+
+        default_decoder = Request.json_decoder
+        Request.set_json_decoder(lambda body: {"decoded": body})
+        try:
+            await app(scope, receive, send)
+        finally:
+            Request.set_json_decoder(default_decoder)
+
+        assert seen == [{"decoded": b"raw"}]
+        assert Request.json_decoder(b'{"a": 1}') == {"a": 1}
+
+    def test_request_headers(self):
+        """Test header access through the headers dict and get_header"""
+        from artanis import Request
+
+        scope = {
+            "type": "http",
+            "headers": [(b"content-type", b"text/plain"), (b"X-Token", b"abc")],
+        }
+        request = Request(scope, AsyncMock())
+
+        assert request.get_header("Content-Type") == "text/plain"
+        assert request.get_header("x-token") == "abc"
+        assert request.get_header("missing") is None
+        assert request.get_header("missing", "fallback") == "fallback"
+        assert "headers" not in request.__dict__
+
+        assert request.headers == {"content-type": "text/plain", "x-token": "abc"}
+        assert request.get_header("X-TOKEN") == "abc"
+
+    @pytest.mark.asyncio
+    async def test_request_body_chunks(self):
+        """Test request bodies sent in one or several messages"""
+        from artanis import Request
+
+        receive = AsyncMock()
+        receive.side_effect = [{"type": "http.request", "body": b"single"}]
+        request = Request({"type": "http"}, receive)
+        assert await request.body() == b"single"
+        assert await request.body() == b"single"
+
+        receive = AsyncMock()
+        receive.side_effect = [
+            {"type": "http.request", "body": b"ab", "more_body": True},
+            {"type": "http.request", "body": b"cd", "more_body": True},
+            {"type": "http.request", "body": b"ef"},
+        ]
+        request = Request({"type": "http"}, receive)
+        assert await request.body() == b"abcdef"
+
+    @pytest.mark.asyncio
+    async def test_websocket_rejected(self):
+        """Test that WebSocket connections are closed before accept"""
+        from artanis import App
+
+        app = App()
+        send = AsyncMock()
+
+        await app({"type": "websocket", "path": "/ws"}, AsyncMock(), send)
+
+        send.assert_called_once_with({"type": "websocket.close", "code": 1000})
+
     def test_multiple_path_parameters(self):
         """Test routes with multiple path parameters"""
         from artanis import App
@@ -20,6 +20,7 @@ from artanis.exceptions import (
 )
 from artanis.middleware.exception import (
     ExceptionHandlerMiddleware,
+    ProductionExceptionHandlerMiddleware,
     ValidationMiddleware,
 )
 from artanis.middleware.response import Response
@@ -434,6 +435,50 @@ class TestExceptionHandlerMiddleware:
         assert response_data["exception_type"] == "ValueError"
         assert "traceback" in response_data
 
+    @pytest.mark.asyncio
+    async def test_production_middleware_hides_details(self):
+        """Test production middleware never exposes exception details."""
+        middleware = ProductionExceptionHandlerMiddleware()
+        assert middleware.debug is False
+        assert middleware.include_traceback is False
+
+        request = MagicMock()
+        request.scope = {"method": "GET", "path": "/test"}
+        response = Response()
+
+        async def failing_middleware():
+            msg = "Secret internal state"
+            raise ValueError(msg)
+
+        result = await middleware(request, response, failing_middleware)
+
+        assert result.status == 500
+        response_data = json.loads(result.to_bytes().decode())
+        assert response_data == {
+            "error": "Internal Server Error",
+            "error_code": "INTERNAL_ERROR",
+            "status_code": 500,
+        }
+
+    @pytest.mark.asyncio
+    async def test_production_middleware_handles_artanis_exception(self):
+        """Test production middleware still reports ArtanisException details."""
+        middleware = ProductionExceptionHandlerMiddleware()
+        request = MagicMock()
+        request.scope = {"method": "GET", "path": "/test"}
+        response = Response()
+
+        async def failing_middleware():
+            msg = "Invalid data"
+            raise ValidationError(msg, field="email")
+
+        result = await middleware(request, response, failing_middleware)
+
+        assert result.status == 400
+        response_data = json.loads(result.to_bytes().decode())
+        assert response_data["error_code"] == "VALIDATION_ERROR"
+        assert "traceback" not in response_data
+
 
 class TestValidationMiddleware:
     """Test the ValidationMiddleware."""
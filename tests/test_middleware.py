@@ -65,6 +65,23 @@ class TestMiddleware:
         assert global_middleware in app.global_middleware
         assert path_middleware in app.path_middleware["/admin"]
 
+    def test_has_middleware(self):
+        """Test has_middleware reports global and path middleware"""
+        from artanis import App
+
+        async def middleware(request, response, next):
+            await next()
+
+        app = App(enable_request_logging=False)
+        assert not app.middleware_manager.has_middleware()
+
+        app.use("/admin", middleware)
+        assert app.middleware_manager.has_middleware()
+
+        app.middleware_manager.clear()
+        app.use(middleware)
+        assert app.middleware_manager.has_middleware()
+
     def test_multiple_middleware_same_path(self):
         """Test multiple middleware registered for the same path"""
         from artanis import App
@@ -851,3 +868,34 @@ class TestMiddleware:
             else:
                 # 6th request should be rate limited
                 assert status_calls[0][0][0]["status"] == 429
+
+    @pytest.mark.asyncio
+    async def test_custom_json_encoder(self):
+        """Test that Response.set_json_encoder changes how responses are encoded"""
+        from artanis import App, Response
+
+        app = App(enable_request_logging=False)
+
+        async def handler():
+            return {"message": "encoded"}
+
+        app.get("/encoded", handler)
+
+        default_encoder = Response.json_encoder
+        Response.set_json_encoder(lambda data: b"custom:" + repr(data).encode())
+        try:
+            scope = {"type": "http", "method": "GET", "path": "/encoded", "headers": []}
+            receive = AsyncMock()
+            send = AsyncMock()
+
+            await app(scope, receive, send)
+        finally:
+            Response.set_json_encoder(default_encoder)
+
+        body_calls = [
+            call
+            for call in send.call_args_list
+            if call[0][0].get("type") == "http.response.body"
+        ]
+        assert body_calls[0][0][0]["body"] == b"custom:{'message': 'encoded'}"
+        assert Response().json_encoder({"a": 1}) == b'{"a": 1}'
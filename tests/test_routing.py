@@ -227,6 +227,66 @@ class TestRouter:
         assert params == {}
         assert source_router is None
 
+    def test_router_static_segment_precedence(self):
+        """Test static segments win over parameters regardless of order."""
+        router = Router()
+
+        def get_user():
+            return {"message": "user"}
+
+        def get_me():
+            return {"message": "me"}
+
+        router.get("/users/{user_id}", get_user)
+        router.get("/users/me", get_me)
+
+        route, params, _ = router.find_route("GET", "/users/me")
+        assert route is not None
+        assert route.handler == get_me
+        assert params == {}
+
+        route, params, _ = router.find_route("GET", "/users/42")
+        assert route is not None
+        assert route.handler == get_user
+        assert params == {"user_id": "42"}
+
+    def test_router_parameter_names_per_route(self):
+        """Test routes sharing a parameter position keep their own names."""
+        router = Router()
+
+        def get_user():
+            return {"message": "get"}
+
+        def delete_user():
+            return {"message": "delete"}
+
+        router.get("/users/{user_id}", get_user)
+        router.delete("/users/{uid}", delete_user)
+
+        route, params, _ = router.find_route("GET", "/users/1")
+        assert route is not None
+        assert route.handler == get_user
+        assert params == {"user_id": "1"}
+
+        route, params, _ = router.find_route("DELETE", "/users/1")
+        assert route is not None
+        assert route.handler == delete_user
+        assert params == {"uid": "1"}
+
+    def test_router_find_route_mixed_segment(self):
+        """Test parameters embedded in a larger path segment."""
+        router = Router()
+
+        def handler():
+            return {"message": "file"}
+
+        router.get("/files/{name}.json", handler)
+
+        route, params, _ = router.find_route("GET", "/files/report.json")
+        assert route is not None
+        assert params == {"name": "report"}
+        assert router.find_route("GET", "/files/report.xml")[0] is None
+
     def test_router_get_allowed_methods(self):
         """Test getting allowed methods for a path."""
         router = Router()
@@ -382,6 +442,70 @@ class TestSubrouting:
         assert "/main" in paths
         assert "/api/sub" in paths
 
+    def test_routes_added_after_lookup(self):
+        """Test routes registered after the router has resolved a request."""
+        main_router = Router()
+        sub_router = Router()
+
+        def handler():
+            return {"message": "late"}
+
+        main_router.mount("/api", sub_router)
+        assert main_router.find_route("GET", "/late")[0] is None
+
+        main_router.get("/late", handler)
+
+        route, params, source_router = main_router.find_route("GET", "/late")
+        assert route is not None
+        assert route.handler == handler
+        assert source_router == main_router
+
+    def test_build_flattens_nested_mounts(self):
+        """Test build() resolves nested mounts from the root router."""
+        main_router = Router()
+        api_router = Router()
+        users_router = Router()
+
+        def handler():
+            return {"message": "user"}
+
+        users_router.get("/{user_id}", handler)
+        api_router.mount("/users", users_router)
+        main_router.mount("/api/v1", api_router)
+        main_router.build()
+
+        route, params, source_router = main_router.find_route("GET", "/api/v1/users/5")
+        assert route is not None
+        assert params == {"user_id": "5"}
+        assert source_router == users_router
+
+    def test_mount_requires_segment_boundary(self):
+        """Test a mount path only matches whole path segments."""
+        main_router = Router()
+        sub_router = Router()
+
+        def handler():
+            return {"message": "sub"}
+
+        sub_router.get("/items", handler)
+        main_router.mount("/api", sub_router)
+
+        assert main_router.find_route("GET", "/api/items")[0] is not None
+        assert main_router.find_route("GET", "/apix/items")[0] is None
+
+    def test_parameterized_subrouter_allowed_methods(self):
+        """Test allowed methods are found through parameterized mounts."""
+        main_router = Router()
+        user_router = Router()
+
+        def handler():
+            return {"message": "profile"}
+
+        user_router.get("/profile", handler)
+        main_router.mount("/users/{user_id}", user_router)
+
+        assert main_router.get_allowed_methods("/users/7/profile") == ["GET"]
+
 
 class TestAppIntegration:
     """Test integration of Router with App class."""
@@ -583,7 +707,7 @@ class TestAllMethod:
             route, params = app._find_route(method, "/api/123")
             assert route is not None
             assert params == {"resource_id": "123"}
-            assert route["handler"] == handler
+            assert route.handler == handler
 
     def test_all_method_mixed_with_specific_methods(self):
         """Test .all() method mixed with specific method registrations."""
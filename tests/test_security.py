@@ -18,6 +18,7 @@ from artanis.middleware.security import (
     RateLimitMiddleware,
     SecurityConfig,
     SecurityHeadersMiddleware,
+    TokenBucketRateLimitMiddleware,
 )
 
 
@@ -632,3 +633,76 @@ class TestRateLimitMiddleware:
         # Second request from second IP should also be rate limited (limit is 1)
         with pytest.raises(RateLimitError):
             rate_limit(request2, next_func)
+
+
+class TestTokenBucketRateLimitMiddleware:
+    """Test token bucket rate limiting middleware."""
+
+    @staticmethod
+    def _next_func(req):
+        response = Response()
+        response.body = "success"
+        response.status = 200
+        return response
+
+    @staticmethod
+    def _request(host="192.168.1.1"):
+        request = Mock()
+        request.headers = {}
+        request.client = {"host": host}
+        return request
+
+    def test_allows_burst_up_to_capacity(self):
+        """Test that a full bucket allows a burst of requests."""
+        rate_limit = TokenBucketRateLimitMiddleware(
+            requests_per_window=3, window_seconds=60
+        )
+        request = self._request()
+
+        for i in range(3):
+            response = rate_limit(request, self._next_func)
+            assert response.status == 200
+            assert response.headers["X-RateLimit-Limit"] == "3"
+            assert int(response.headers["X-RateLimit-Remaining"]) == 2 - i
+
+        with pytest.raises(RateLimitError) as exc_info:
+            rate_limit(request, self._next_func)
+
+        assert exc_info.value.details["limit"] == 3
+        assert exc_info.value.details["retry_after"] >= 1
+
+    def test_tokens_refill_over_time(self):
+        """Test that tokens are refilled continuously."""
+        rate_limit = TokenBucketRateLimitMiddleware(
+            requests_per_window=2, window_seconds=1
+        )
+        request = self._request()
+
+        rate_limit(request, self._next_func)
+        rate_limit(request, self._next_func)
+        with pytest.raises(RateLimitError):
+            rate_limit(request, self._next_func)
+
+        # Refill rate is 2 tokens per second
+        time.sleep(0.6)
+
+        response = rate_limit(request, self._next_func)
+        assert response.status == 200
+
+    def test_least_recently_used_keys_are_evicted(self):
+        """Test that tracked keys are bounded by max_keys."""
+        rate_limit = TokenBucketRateLimitMiddleware(
+            requests_per_window=1, window_seconds=60, max_keys=2
+        )
+
+        for host in ("10.0.0.1", "10.0.0.2", "10.0.0.3"):
+            rate_limit(self._request(host), self._next_func)
+
+        assert list(rate_limit._buckets) == [
+            "rate_limit:10.0.0.2",
+            "rate_limit:10.0.0.3",
+        ]
+
+        # The evicted client starts again with a full bucket
+        response = rate_limit(self._request("10.0.0.1"), self._next_func)
+        assert response.status == 200